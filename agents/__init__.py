@@ -2,5 +2,6 @@
 from .planner import PlannerAgent
 from .executor import ExecutorAgent
 from .verifier import VerifierAgent
+from .plan_merger import PlanMerger
 
-__all__ = ["PlannerAgent", "ExecutorAgent", "VerifierAgent"]
+__all__ = ["PlannerAgent", "ExecutorAgent", "VerifierAgent", "PlanMerger"]
@@ -3,29 +3,132 @@ Executor Agent for AI Operations Assistant.
 Executes plans by calling appropriate tools and handling errors.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import sys
 import os
+import time
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from tools.github_tool import GitHubTool
 from tools.weather_tool import WeatherTool
 from tools.news_tool import NewsTool
+from records import StepResult
+from metrics import TOOL_CALLS, TOOL_SECONDS
+from cache.result_cache import RefreshingCache
 
 
 class ExecutorAgent:
     """Agent that executes plans by calling tools."""
     
-    def __init__(self):
-        """Initialize executor agent with tools."""
-        self.tools = {
-            "github_search": GitHubTool(),
-            "weather_fetch": WeatherTool(),
-            "news_fetch": NewsTool()
-        }
+    TOOL_CLASSES = {
+        "github_search": GitHubTool,
+        "weather_fetch": WeatherTool,
+        "news_fetch": NewsTool
+    }
     
-    def execute_plan(self, plan: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def __init__(self, result_cache: Optional[RefreshingCache] = None):
+        """
+        Initialize executor agent; tools are created on first use.
+        
+        Args:
+            result_cache: Optional cache for tool results, namespaced by tool name
+        """
+        self.tools = {}
+        self.result_cache = result_cache
+    
+    def _get_tool(self, tool_name: str) -> Any:
+        """Get a tool instance, creating it on first use."""
+        if tool_name not in self.tools:
+            self.tools[tool_name] = self.TOOL_CLASSES[tool_name]()
+        return self.tools[tool_name]
+    
+    def warm_up(self) -> None:
+        """Create every tool with its HTTP session (and lazy helpers) ahead of the first task."""
+        for tool_name in self.TOOL_CLASSES:
+            tool = self._get_tool(tool_name)
+            tool.session
+            if tool_name == "news_fetch":
+                tool.ranker
+    
+    def _call_tool(self, tool_name: str, tool_input: str) -> Any:
+        """
+        Call one tool.
+        
+        Args:
+            tool_name: Name of the tool
+            tool_input: Input for the tool
+            
+        Returns:
+            Tool result record
+            
+        Raises:
+            ValueError: If the tool is unknown
+        """
+        if tool_name not in self.TOOL_CLASSES:
+            raise ValueError(f"Unknown tool: {tool_name}")
+        
+        tool = self._get_tool(tool_name)
+        
+        if tool_name == "github_search":
+            return tool.search_repositories(tool_input)
+        elif tool_name == "weather_fetch":
+            return tool.get_weather(tool_input)
+        elif tool_name == "news_fetch":
+            return tool.get_news(tool_input)
+        else:
+            raise ValueError(f"Tool not implemented: {tool_name}")
+    
+    def _fetch(self, tool_name: str, tool_input: str) -> Any:
+        """Call a tool through the result cache, if one is configured."""
+        if self.result_cache is None or tool_name not in self.TOOL_CLASSES:
+            return self._call_tool(tool_name, tool_input)
+        
+        key = " ".join(str(tool_input).lower().split())
+        return self.result_cache.get_or_load(
+            tool_name, key, lambda: self._call_tool(tool_name, tool_input)
+        )
+    
+    def execute_step(self, step_number: int, tool_name: str, tool_input: str) -> StepResult:
+        """
+        Execute one tool call, recording its outcome instead of raising.
+        
+        Args:
+            step_number: Step number to report in the result
+            tool_name: Name of the tool
+            tool_input: Input for the tool
+            
+        Returns:
+            Step result with status "success" or "error"
+        """
+        start = time.perf_counter()
+        try:
+            result = self._fetch(tool_name, tool_input)
+            TOOL_SECONDS.observe(time.perf_counter() - start, tool=tool_name)
+            TOOL_CALLS.inc(tool=tool_name, status="success")
+            
+            print("  Status: Success")
+            return StepResult(
+                step=step_number,
+                tool=tool_name,
+                input=tool_input,
+                status="success",
+                result=result
+            )
+            
+        except Exception as e:
+            TOOL_SECONDS.observe(time.perf_counter() - start, tool=tool_name)
+            TOOL_CALLS.inc(tool=tool_name, status="error")
+            print(f"  Status: Error - {e}")
+            return StepResult(
+                step=step_number,
+                tool=tool_name,
+                input=tool_input,
+                status="error",
+                error=str(e)
+            )
+    
+    def execute_plan(self, plan: Dict[str, Any]) -> List[StepResult]:
         """
         Execute a plan by calling tools for each step.
         
@@ -45,40 +148,6 @@ class ExecutorAgent:
             print(f"  Tool: {tool_name}")
             print(f"  Input: {tool_input}")
             
-            try:
-                if tool_name not in self.tools:
-                    raise ValueError(f"Unknown tool: {tool_name}")
-                
-                tool = self.tools[tool_name]
-                
-                if tool_name == "github_search":
-                    result = tool.search_repositories(tool_input)
-                elif tool_name == "weather_fetch":
-                    result = tool.get_weather(tool_input)
-                elif tool_name == "news_fetch":
-                    result = tool.get_news(tool_input)
-                else:
-                    raise ValueError(f"Tool not implemented: {tool_name}")
-                
-                results.append({
-                    "step": i + 1,
-                    "tool": tool_name,
-                    "input": tool_input,
-                    "status": "success",
-                    "result": result
-                })
-                
-                print("  Status: Success")
-                
-            except Exception as e:
-                error_result = {
-                    "step": i + 1,
-                    "tool": tool_name,
-                    "input": tool_input,
-                    "status": "error",
-                    "error": str(e)
-                }
-                results.append(error_result)
-                print(f"  Status: Error - {e}")
+            results.append(self.execute_step(i + 1, tool_name, tool_input))
         
         return results
@@ -0,0 +1,193 @@
+"""
+Plan Merger for AI Operations Assistant.
+Collects plans submitted within a short window, runs each unique tool call
+once (all calls of a batch concurrently), and fans the results back out to
+every task.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from config import Config
+from agents.executor import ExecutorAgent
+from records import PlanStep, StepResult
+
+
+class _Batch:
+    """Plans collected during one window."""
+
+    def __init__(self):
+        self.plans: List[Mapping] = []
+        self.arrivals: List[float] = []
+        # None when the batch had no shared calls: each task runs its own plan
+        self.results: Optional[List[List[StepResult]]] = None
+        self.error = None
+        self.done = threading.Event()
+
+
+def _call_key(step: Mapping) -> Tuple[str, str]:
+    """Identity of a tool call: tool name plus case/whitespace-normalized input."""
+    return step["tool"], " ".join(str(step["input"]).lower().split())
+
+
+class PlanMerger:
+    """Executes overlapping plans from concurrent tasks as one combined plan."""
+
+    def __init__(self, executor: ExecutorAgent, window: float = Config.PLAN_MERGE_WINDOW_MS / 1000):
+        """
+        Initialize plan merger.
+
+        Args:
+            executor: Executor used for the combined plan
+            window: Seconds to collect plans before executing a batch
+        """
+        self.executor = executor
+        self.window = window
+        self._open = None
+        self._lock = threading.Lock()
+
+        self._stats_lock = threading.Lock()
+        self._counts = {
+            "batches": 0, "merged_batches": 0, "tasks": 0, "steps_requested": 0, "unique_calls": 0
+        }
+        self._added = deque(maxlen=1000)
+
+    def execute(self, plan: Mapping) -> List[StepResult]:
+        """
+        Execute a plan, sharing tool calls with plans submitted in the same window.
+
+        The first plan of a window waits for it to close and then runs the
+        batch's unique calls concurrently; later plans wait for that run to
+        finish. A batch without shared calls is not merged: each task then
+        runs its own plan.
+
+        Args:
+            plan: Execution plan with steps
+
+        Returns:
+            Results for this plan's steps, numbered as in the plan
+        """
+        with self._lock:
+            batch = self._open
+            leader = batch is None
+            if leader:
+                batch = _Batch()
+                self._open = batch
+            index = len(batch.plans)
+            batch.plans.append(plan)
+            arrival = time.perf_counter()
+            batch.arrivals.append(arrival)
+
+        if leader:
+            time.sleep(self.window)
+            with self._lock:
+                self._open = None
+            try:
+                self._run(batch)
+            except Exception as e:
+                batch.error = e
+            finally:
+                batch.done.set()
+        else:
+            batch.done.wait()
+
+        if batch.error is not None:
+            raise batch.error
+        if batch.results is not None:
+            return batch.results[index]
+
+        # Unmerged: the only latency added is the collection window
+        self._record_added(time.perf_counter() - arrival)
+        return self.executor.execute_plan(plan)
+
+    def _run(self, batch: _Batch) -> None:
+        """Execute the unique tool calls of a batch concurrently and fan results back out."""
+        unique: Dict[Tuple[str, str], int] = {}
+        unique_steps: List[PlanStep] = []
+        steps_requested = 0
+        for plan in batch.plans:
+            for step in plan["steps"]:
+                steps_requested += 1
+                key = _call_key(step)
+                if key not in unique:
+                    unique[key] = len(unique_steps)
+                    unique_steps.append(PlanStep(step["tool"], step["input"]))
+
+        merged = len(unique_steps) < steps_requested
+        with self._stats_lock:
+            self._counts["batches"] += 1
+            self._counts["merged_batches"] += int(merged)
+            self._counts["tasks"] += len(batch.plans)
+            self._counts["steps_requested"] += steps_requested
+            self._counts["unique_calls"] += len(unique_steps)
+
+        if not merged:
+            # Nothing to share: don't make tasks wait on each other's calls
+            return
+
+        print(f"\n[Merger] {len(batch.plans)} plan(s), {steps_requested} step(s) -> "
+              f"{len(unique_steps)} unique call(s)")
+
+        durations = [0.0] * len(unique_steps)
+
+        def call(i: int) -> StepResult:
+            start = time.perf_counter()
+            try:
+                return self.executor.execute_step(i + 1, unique_steps[i]["tool"], unique_steps[i]["input"])
+            finally:
+                durations[i] = time.perf_counter() - start
+
+        with ThreadPoolExecutor(max_workers=len(unique_steps), thread_name_prefix="plan-merge") as pool:
+            shared = list(pool.map(call, range(len(unique_steps))))
+        finished = time.perf_counter()
+
+        batch.results = []
+        for plan, arrival in zip(batch.plans, batch.arrivals):
+            results = []
+            own = set()
+            for i, step in enumerate(plan["steps"]):
+                call_index = unique[_call_key(step)]
+                own.add(call_index)
+                outcome = shared[call_index]
+                results.append(StepResult(
+                    step=i + 1,
+                    tool=step["tool"],
+                    input=step["input"],
+                    status=outcome.status,
+                    result=outcome.result,
+                    error=outcome.error
+                ))
+            batch.results.append(results)
+            # Unmerged, the executor would have run this plan's calls one after another
+            self._record_added((finished - arrival) - sum(durations[c] for c in own))
+
+    def _record_added(self, seconds: float) -> None:
+        with self._stats_lock:
+            self._added.append(seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get merging statistics.
+
+        The added latency of a task is its time in the merger minus the time
+        its own calls take when run one after another (as without merging);
+        it is negative when sharing calls made the task faster.
+
+        Returns:
+            Dictionary with counts, fan-in ratio (steps requested per unique
+            call executed) and the end-to-end latency added per task
+        """
+        with self._stats_lock:
+            counts = dict(self._counts)
+            added = sorted(self._added)
+
+        return {
+            **counts,
+            "fan_in_ratio": counts["steps_requested"] / counts["unique_calls"] if counts["unique_calls"] else 0.0,
+            "tasks_per_batch": counts["tasks"] / counts["batches"] if counts["batches"] else 0.0,
+            "added_latency_avg_ms": sum(added) / len(added) * 1000 if added else 0.0,
+            "added_latency_p95_ms": added[min(len(added) - 1, int(0.95 * len(added)))] * 1000 if added else 0.0
+        }
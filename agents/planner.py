@@ -3,23 +3,65 @@ Planner Agent for AI Operations Assistant.
 Converts natural language tasks into structured execution plans.
 """
 
-from typing import Dict, Any
+from typing import Any, Dict, Optional, TYPE_CHECKING
+from llm.json_extractor import RepairedJSON
 from llm.openrouter_client import OpenRouterClient
+from records import Plan
+
+if TYPE_CHECKING:
+    from cache.result_cache import RefreshingCache
+    from cache.semantic_cache import SemanticCache
+
+
+VALID_TOOLS = ("github_search", "weather_fetch", "news_fetch")
+
+
+def validate_plan(plan: Dict[str, Any]) -> None:
+    """
+    Check planner JSON before it is used.
+    
+    Args:
+        plan: Parsed planner output
+        
+    Raises:
+        ValueError: If the plan is malformed
+    """
+    if "steps" not in plan:
+        raise ValueError("Plan must contain 'steps' key")
+    
+    if not isinstance(plan["steps"], list):
+        raise ValueError("Steps must be a list")
+    
+    for step in plan["steps"]:
+        if not isinstance(step, dict) or "tool" not in step or "input" not in step:
+            raise ValueError("Each step must have 'tool' and 'input' keys")
+        
+        if step["tool"] not in VALID_TOOLS:
+            raise ValueError(f"Invalid tool: {step['tool']}")
 
 
 class PlannerAgent:
     """Agent that creates execution plans from natural language tasks."""
     
-    def __init__(self, llm_client: OpenRouterClient):
+    def __init__(
+        self,
+        llm_client: OpenRouterClient,
+        plan_cache: Optional["SemanticCache"] = None,
+        result_cache: Optional["RefreshingCache"] = None
+    ):
         """
         Initialize planner agent.
         
         Args:
             llm_client: OpenRouter client instance
+            plan_cache: Optional semantic cache for reusing plans of similar tasks
+            result_cache: Optional exact-match cache that refreshes hot plans in the background
         """
         self.llm = llm_client
+        self.plan_cache = plan_cache
+        self.result_cache = result_cache
     
-    def create_plan(self, task: str) -> Dict[str, Any]:
+    def create_plan(self, task: str) -> Plan:
         """
         Create a structured execution plan from a natural language task.
         
@@ -27,8 +69,31 @@ class PlannerAgent:
             task: Natural language description of the task
             
         Returns:
-            Dictionary containing structured plan with steps
+            Plan record containing structured steps
         """
+        if self.result_cache is not None:
+            key = " ".join(task.lower().split())
+            return self.result_cache.get_or_load(
+                "plan", key,
+                lambda: self._lookup_or_plan(task),
+                refresher=lambda: self._plan_with_llm(task),
+                cacheable=lambda plan: not plan.degraded
+            )
+        return self._lookup_or_plan(task)
+    
+    def _lookup_or_plan(self, task: str) -> Plan:
+        """Reuse a plan for a similar task if cached, otherwise ask the LLM."""
+        if self.plan_cache is not None:
+            cached = self.plan_cache.get(task)
+            if cached is not None:
+                plan, similarity = cached
+                print(f"[Planner] Reusing cached plan (similarity {similarity:.2f})")
+                return plan
+        
+        return self._plan_with_llm(task)
+    
+    def _plan_with_llm(self, task: str) -> Plan:
+        """Create a plan with the LLM and store it in the semantic cache."""
         system_prompt = """You are a planning agent for an AI Operations Assistant. 
 Your task is to convert natural language requests into structured execution plans.
 
@@ -67,20 +132,13 @@ Rules:
         ]
         
         try:
-            plan = self.llm.call_llm_with_json(messages)
-            
-            if "steps" not in plan:
-                raise ValueError("Plan must contain 'steps' key")
-            
-            if not isinstance(plan["steps"], list):
-                raise ValueError("Steps must be a list")
+            raw_plan = self.llm.call_llm_with_json(messages, validate=validate_plan)
+            plan = Plan.from_dict(raw_plan, degraded=isinstance(raw_plan, RepairedJSON))
             
-            for step in plan["steps"]:
-                if "tool" not in step or "input" not in step:
-                    raise ValueError("Each step must have 'tool' and 'input' keys")
-                
-                if step["tool"] not in ["github_search", "weather_fetch", "news_fetch"]:
-                    raise ValueError(f"Invalid tool: {step['tool']}")
+            if plan.degraded:
+                print("[Planner] Plan was repaired from truncated output; not caching it")
+            elif self.plan_cache is not None:
+                self.plan_cache.put(task, plan)
             
             return plan
             
@@ -1,121 +1,297 @@
 """
 Verifier Agent for AI Operations Assistant.
 Validates execution results and creates final structured summary.
+Per-step summaries are cached by result content, so only new or changed
+step results are sent to the LLM.
 """
 
-from typing import Dict, Any, List
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Dict, List, Optional, Tuple
+from config import Config
+from llm.json_extractor import RepairedJSON
 from llm.openrouter_client import OpenRouterClient
+from records import Verification, VerificationDetails, dumps
 
 
 class VerifierAgent:
     """Agent that verifies results and creates final summaries."""
     
-    def __init__(self, llm_client: OpenRouterClient):
+    def __init__(self, llm_client: OpenRouterClient, cache_size: int = Config.VERIFIER_CACHE_SIZE):
         """
         Initialize verifier agent.
         
         Args:
             llm_client: OpenRouter client instance
+            cache_size: Maximum per-step summaries kept (least recently used are evicted)
         """
         self.llm = llm_client
+        self.cache_size = cache_size
+        self._summaries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counts = {"steps_cached": 0, "steps_summarized": 0, "llm_calls": 0}
     
-    def verify_results(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def verify_results(self, results: List[Mapping]) -> Verification:
         """
         Verify execution results and create final structured summary.
         
+        Successful steps seen before (same tool, input and result) reuse their
+        cached summary; only the remaining ones go to the LLM, in one call.
+        Failed steps are summarized without the LLM.
+        
         Args:
             results: List of execution results from executor
             
         Returns:
-            Dictionary containing verified summary and status
+            Verification record containing verified summary and status
+        """
+        try:
+            summaries: List[Dict[str, Any]] = [None] * len(results)
+            pending: List[Tuple[int, str]] = []
+            reused = 0
+            
+            for i, result in enumerate(results):
+                if result.get("status") != "success":
+                    summaries[i] = self._error_summary(i, result)
+                    continue
+                key = self._step_key(result)
+                cached = self._cache_get(key)
+                if cached is not None:
+                    summaries[i] = cached
+                    reused += 1
+                else:
+                    pending.append((i, key))
+            
+            with self._lock:
+                self._counts["steps_cached"] += reused
+                self._counts["steps_summarized"] += len(pending)
+            
+            if pending:
+                fresh, degraded = self._summarize_steps([(i, results[i]) for i, _ in pending])
+                for i, key in pending:
+                    summaries[i] = fresh[i]
+                    # Summaries repaired from truncated output may be incomplete
+                    if not degraded:
+                        self._cache_put(key, fresh[i])
+            
+            return self._merge(results, summaries)
+            
+        except Exception as e:
+            return Verification(
+                status="failed",
+                summary=f"Failed to verify results: {str(e)}",
+                details=VerificationDetails.for_results(results, ["Verification failed"]),
+                final_answer={},
+                error=str(e)
+            )
+    
+    def _summarize_steps(self, steps: List[Tuple[int, Mapping]]) -> Tuple[Dict[int, Dict[str, Any]], bool]:
+        """
+        Ask the LLM to summarize a set of successful step results.
+        
+        Args:
+            steps: (index in the plan, step result) pairs
+            
+        Returns:
+            Per-step summary dicts keyed by index, and whether the response
+            was repaired from truncated output
         """
         system_prompt = """You are a verification agent for an AI Operations Assistant.
-Your task is to review execution results and create a final structured summary.
+Your task is to review individual step results and summarize each one.
 
-Analyze the results:
-1. Check if all steps completed successfully
-2. Verify data completeness and formatting
-3. Identify any missing or incomplete information
-4. Create a clear, structured final answer
+For each step:
+1. Verify data completeness and formatting
+2. Identify any missing or incomplete information
+3. Summarize what the step returned in one or two sentences
+4. Extract the key data as structured values
 
 Output ONLY valid JSON in this format:
 {
-  "status": "success|partial|failed",
-  "summary": "Clear summary of what was accomplished",
-  "details": {
-    "total_steps": number,
-    "successful_steps": number,
-    "failed_steps": number,
-    "findings": ["key findings from results"]
-  },
-  "final_answer": {
-    "structured_data": {
-      "key": "value"
+  "steps": [
+    {
+      "step": number,
+      "summary": "What this step returned",
+      "findings": ["key findings from this step"],
+      "data": {
+        "topic": "value"
+      }
     }
-  }
+  ]
 }
 
 Rules:
 1. Output ONLY JSON, no other text
-2. Be thorough in your analysis
+2. Include one entry per step, using the step numbers given
 3. If data is missing, note it in findings
-4. Organize final_answer clearly by topic
+4. Key "data" by topic (e.g. "weather_london", "top_repository")
 """
         
-        results_str = self._format_results_for_llm(results)
-        user_message = f"Review these execution results and create a final summary:\n\n{results_str}"
+        results_str = self._format_results_for_llm(steps)
+        user_message = f"Review these step results and summarize each step:\n\n{results_str}"
         
         messages = [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_message}
         ]
         
-        try:
-            verification = self.llm.call_llm_with_json(messages)
+        with self._lock:
+            self._counts["llm_calls"] += 1
+        response = self.llm.call_llm_with_json(
+            messages, validate=lambda r: self._match_summaries(r, steps)
+        )
+        return self._match_summaries(response, steps), isinstance(response, RepairedJSON)
+    
+    def _match_summaries(self, response: Mapping, steps: List[Tuple[int, Mapping]]) -> Dict[int, Dict[str, Any]]:
+        """
+        Pair each requested step with its entry in the LLM response.
+        
+        Args:
+            response: Parsed LLM output with a "steps" list
+            steps: (index in the plan, step result) pairs that were sent
             
-            if "status" not in verification or "summary" not in verification:
-                raise ValueError("Verification must contain 'status' and 'summary' keys")
+        Returns:
+            Per-step summary dicts keyed by index
             
-            verification["raw_results"] = results
-            return verification
+        Raises:
+            ValueError: If the response is malformed or misses a step
+        """
+        entries = response.get("steps")
+        if not isinstance(entries, list):
+            raise ValueError("Verification must contain a 'steps' list")
+        by_number = {
+            entry.get("step"): entry for entry in entries
+            if isinstance(entry, Mapping)
+        }
+        
+        summaries = {}
+        for position, (i, result) in enumerate(steps):
+            entry = by_number.get(i + 1)
+            if entry is None and len(entries) == len(steps) and isinstance(entries[position], Mapping):
+                entry = entries[position]
+            if entry is None or "summary" not in entry:
+                raise ValueError(f"Verification is missing a summary for step {i + 1}")
             
-        except Exception as e:
-            return {
-                "status": "failed",
-                "summary": f"Failed to verify results: {str(e)}",
-                "details": {
-                    "total_steps": len(results),
-                    "successful_steps": sum(1 for r in results if r.get("status") == "success"),
-                    "failed_steps": sum(1 for r in results if r.get("status") == "error"),
-                    "findings": ["Verification failed"]
-                },
-                "final_answer": {},
-                "error": str(e)
+            findings = entry.get("findings") or []
+            if isinstance(findings, str):
+                findings = [findings]
+            data = entry.get("data")
+            summaries[i] = {
+                "summary": str(entry["summary"]),
+                "findings": [str(f) for f in findings],
+                "data": dict(data) if isinstance(data, Mapping) else {}
             }
+        return summaries
+    
+    def _merge(self, results: List[Mapping], summaries: List[Dict[str, Any]]) -> Verification:
+        """Combine per-step summaries into the task's verification."""
+        succeeded = sum(1 for r in results if r.get("status") == "success")
+        if results and succeeded == len(results):
+            status = "success"
+        elif succeeded:
+            status = "partial"
+        else:
+            status = "failed"
+        
+        findings = []
+        for summary in summaries:
+            findings.extend(summary["findings"])
+        structured_data = self._merge_data(results, summaries)
+        
+        return Verification(
+            status=status,
+            summary=" ".join(s["summary"] for s in summaries) or "No steps were executed.",
+            details=VerificationDetails.for_results(results, findings),
+            final_answer={"structured_data": structured_data} if structured_data else {},
+            raw_results=results
+        )
+    
+    def _merge_data(self, results: List[Mapping], summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Combine the structured data of all steps.
+        
+        Summaries from separate LLM calls pick their keys independently, so
+        a key used by several steps with different values is qualified with
+        its step instead of being overwritten.
+        """
+        values: Dict[str, List[Any]] = {}
+        for summary in summaries:
+            for key, value in summary["data"].items():
+                values.setdefault(key, []).append(value)
+        
+        structured_data = {}
+        for i, summary in enumerate(summaries):
+            for key, value in summary["data"].items():
+                if any(other != value for other in values[key]):
+                    key = f"{key} (step {i + 1}: {results[i].get('input', '')})"
+                structured_data[key] = value
+        return structured_data
     
-    def _format_results_for_llm(self, results: List[Dict[str, Any]]) -> str:
-        """Format results for LLM consumption."""
+    def _error_summary(self, index: int, result: Mapping) -> Dict[str, Any]:
+        """Summarize a failed step without the LLM."""
+        tool = result.get("tool", "unknown")
+        error = result.get("error", "Unknown error")
+        return {
+            "summary": f"Step {index + 1} ({tool}) failed: {error}.",
+            "findings": [f"Step {index + 1} ({tool}) returned no data: {error}"],
+            "data": {}
+        }
+    
+    def _step_key(self, result: Mapping) -> str:
+        """Content hash of a step's tool, input and result (not its position)."""
+        content = dumps([result.get("tool"), result.get("input"), result.get("result")])
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            summary = self._summaries.get(key)
+            if summary is not None:
+                self._summaries.move_to_end(key)
+            return summary
+    
+    def _cache_put(self, key: str, summary: Dict[str, Any]) -> None:
+        with self._lock:
+            self._summaries[key] = summary
+            self._summaries.move_to_end(key)
+            while len(self._summaries) > self.cache_size:
+                self._summaries.popitem(last=False)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get per-step summary cache statistics.
+        
+        Returns:
+            Dictionary with cached/summarized step counts, LLM calls, hit ratio and size
+        """
+        with self._lock:
+            stats = dict(self._counts)
+            stats["size"] = len(self._summaries)
+        
+        verified = stats["steps_cached"] + stats["steps_summarized"]
+        stats["hit_ratio"] = stats["steps_cached"] / verified if verified else 0.0
+        return stats
+    
+    def _format_results_for_llm(self, steps: List[Tuple[int, Mapping]]) -> str:
+        """Format step results for LLM consumption."""
         formatted = []
-        for i, result in enumerate(results):
+        for i, result in steps:
             formatted.append(f"Step {i + 1}:")
             formatted.append(f"  Tool: {result.get('tool', 'unknown')}")
-            formatted.append(f"  Status: {result.get('status', 'unknown')}")
+            formatted.append(f"  Input: {result.get('input', '')}")
             
-            if result.get("status") == "success":
-                result_data = result.get('result', {})
-                # Truncate long descriptions to avoid JSON parsing issues
-                if isinstance(result_data, dict):
-                    summary_data = {}
-                    for key, value in result_data.items():
-                        if isinstance(value, str) and len(value) > 200:
-                            summary_data[key] = value[:200] + "... [truncated]"
-                        else:
-                            summary_data[key] = value
-                    formatted.append(f"  Result: {summary_data}")
-                else:
-                    formatted.append(f"  Result: {result_data}")
+            result_data = result.get('result', {})
+            # Truncate long descriptions to avoid JSON parsing issues
+            if isinstance(result_data, Mapping):
+                summary_data = {}
+                for key, value in result_data.items():
+                    if isinstance(value, str) and len(value) > 200:
+                        summary_data[key] = value[:200] + "... [truncated]"
+                    else:
+                        summary_data[key] = value
+                formatted.append(f"  Result: {summary_data}")
             else:
-                formatted.append(f"  Error: {result.get('error', 'Unknown error')}")
+                formatted.append(f"  Result: {result_data}")
             
             formatted.append("")
         
@@ -0,0 +1,67 @@
+"""
+Benchmark for news deduplication and ranking.
+Measures articles/second for batches with syndicated near-duplicates.
+
+Usage:
+    python benchmarks/news_ranker_bench.py [max_articles]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from records import NewsArticle
+from tools.news_ranker import NewsRanker
+
+
+WORDS = (
+    "ai model chip market launch startup funding open source research robot "
+    "policy cloud data privacy security energy climate vote court deal stock"
+).split()
+
+
+def make_batch(n: int, rng: random.Random) -> list:
+    """Build n articles where roughly a third are syndicated copies."""
+    articles = []
+    for i in range(n):
+        if articles and rng.random() < 0.33:
+            original = articles[rng.randrange(len(articles))]
+            title = f"{original.title} - Source {rng.randrange(50)}"
+        else:
+            title = " ".join(rng.choice(WORDS) for _ in range(8)) + f" {i}"
+        articles.append(NewsArticle(
+            title=title,
+            description="",
+            url=f"https://example.com/{i}",
+            source=f"Source {rng.randrange(50)}",
+            published_at=f"2024-01-{rng.randrange(1, 29):02d}T{rng.randrange(24):02d}:00:00Z"
+        ))
+    return articles
+
+
+def run(max_articles: int = 50000) -> None:
+    """
+    Rank batches of increasing size and report throughput.
+
+    Args:
+        max_articles: Largest batch size
+    """
+    ranker = NewsRanker()
+    rng = random.Random(0)
+    print(f"{'articles':>10} {'kept':>8} {'ms':>10} {'articles/s':>12}")
+
+    for n in (1000, 10000, 20000, 50000, 100000):
+        if n > max_articles:
+            break
+        batch = make_batch(n, rng)
+        start = time.perf_counter()
+        kept = ranker.rank(batch, top_k=n)
+        elapsed = time.perf_counter() - start
+        print(f"{n:>10} {len(kept):>8} {elapsed * 1000:>10.1f} {n / elapsed:>12.0f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -0,0 +1,90 @@
+"""
+Benchmark for the worker process pool.
+Runs CPU-bound task post-processing (JSON decoding of large news and GitHub
+payloads plus verifier prompt formatting) serially and across N workers.
+
+Usage:
+    python benchmarks/process_pool_bench.py [tasks]
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.verifier import VerifierAgent
+from workers.process_pool import TaskWorkerPool
+
+
+def _payload(seed: int) -> str:
+    """Build a large synthetic NewsAPI + GitHub response body."""
+    articles = [
+        {
+            "title": f"Story {seed}-{i} about artificial intelligence",
+            "description": "Lorem ipsum dolor sit amet " * 20,
+            "url": f"https://example.com/{seed}/{i}",
+            "source": {"name": f"Source {i % 17}"},
+            "publishedAt": "2024-01-01T00:00:00Z"
+        }
+        for i in range(400)
+    ]
+    repos = [
+        {"name": f"repo-{i}", "stargazers_count": i * 7, "html_url": f"https://github.com/x/{i}",
+         "description": "A repository " * 10}
+        for i in range(400)
+    ]
+    return json.dumps({"status": "ok", "articles": articles, "items": repos})
+
+
+class SyntheticAssistant:
+    """Stand-in assistant doing the pipeline's local CPU work without network calls."""
+
+    def __init__(self):
+        """Initialize with a verifier used only for prompt formatting."""
+        self.verifier = VerifierAgent(llm_client=None)
+
+    def process_task(self, task: str) -> dict:
+        """Decode payloads and format them for the verifier prompt."""
+        data = json.loads(_payload(len(task)))
+        results = [
+            {"step": 1, "tool": "news_fetch", "input": task, "status": "success",
+             "result": {"query": task, "articles": data["articles"]}},
+            {"step": 2, "tool": "github_search", "input": task, "status": "success",
+             "result": data["items"][0]}
+        ]
+        prompt = self.verifier._format_results_for_llm(list(enumerate(results)))
+        return {"status": "success", "chars": len(prompt)}
+
+
+def run(tasks: int = 200) -> None:
+    """
+    Measure task throughput serially and with increasing worker counts.
+
+    Args:
+        tasks: Number of tasks per measurement
+    """
+    batch = [f"task {i}" for i in range(tasks)]
+
+    assistant = SyntheticAssistant()
+    start = time.perf_counter()
+    for task in batch:
+        assistant.process_task(task)
+    serial = tasks / (time.perf_counter() - start)
+    print(f"{'workers':>8} {'tasks/s':>10} {'speedup':>8}")
+    print(f"{'serial':>8} {serial:>10.1f} {1.0:>8.2f}")
+
+    cores = os.cpu_count() or 1
+    counts = sorted({n for n in (1, 2, 4, 8, 16, cores) if n <= cores})
+    for workers in counts:
+        with TaskWorkerPool(workers, factory=SyntheticAssistant) as pool:
+            pool.warm_up()
+            start = time.perf_counter()
+            pool.map(batch)
+            rate = tasks / (time.perf_counter() - start)
+        print(f"{workers:>8} {rate:>10.1f} {rate / serial:>8.2f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
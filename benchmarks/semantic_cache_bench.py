@@ -0,0 +1,72 @@
+"""
+Benchmark for the semantic plan cache.
+Reports hit rate and lookup latency as the index grows.
+
+Usage:
+    python benchmarks/semantic_cache_bench.py [max_entries]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cache.semantic_cache import SemanticCache
+
+
+TEMPLATES = [
+    ("weather in {x} now", "current {x} weather"),
+    ("what's the weather like in {x}?", "weather {x} today"),
+    ("latest news about {x}", "get news on {x}"),
+    ("find top {x} github repo", "top github repository for {x}"),
+]
+
+
+def _entity(i: int) -> str:
+    """Build a unique synthetic entity name."""
+    return f"entity{i}"
+
+
+def run(max_entries: int = 200000, queries: int = 1000) -> None:
+    """
+    Fill the cache and measure paraphrase lookups at several sizes.
+
+    Args:
+        max_entries: Final number of entries in the index
+        queries: Lookups measured at each checkpoint
+    """
+    cache = SemanticCache(max_entries=max_entries)
+    rng = random.Random(0)
+    checkpoints = [c for c in (1000, 10000, 100000, 200000, 500000) if c <= max_entries]
+
+    print(f"{'entries':>10} {'hit_rate':>10} {'p50_ms':>10} {'p95_ms':>10} {'insert/s':>10}")
+
+    filled = 0
+    for checkpoint in checkpoints:
+        start = time.perf_counter()
+        for i in range(filled, checkpoint):
+            original, _ = TEMPLATES[i % len(TEMPLATES)]
+            cache.put(original.format(x=_entity(i)), {"steps": [{"tool": "weather_fetch", "input": _entity(i)}]})
+        insert_rate = (checkpoint - filled) / (time.perf_counter() - start)
+        filled = checkpoint
+
+        # Reset counters so each checkpoint reports its own numbers
+        cache._lookups = cache._hits = 0
+        cache._latencies.clear()
+
+        for _ in range(queries):
+            i = rng.randrange(filled)
+            _, paraphrase = TEMPLATES[i % len(TEMPLATES)]
+            cache.get(paraphrase.format(x=_entity(i)))
+
+        stats = cache.stats()
+        print(
+            f"{filled:>10} {stats['hit_rate']:>10.2%} {stats['lookup_p50_ms']:>10.2f} "
+            f"{stats['lookup_p95_ms']:>10.2f} {insert_rate:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
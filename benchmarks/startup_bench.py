@@ -0,0 +1,98 @@
+"""
+Benchmark for assistant startup time.
+Measures, in fresh interpreters, the time to import main, build the shared
+assistant, get a second (already built) assistant as a new UI session would,
+and create the first plan against a local mock LLM endpoint, so SDK imports
+deferred to first use are counted.
+
+Usage:
+    python benchmarks/startup_bench.py [runs] [--root PATH]
+
+Pass --root to measure another checkout (e.g. a `git worktree` of an older
+commit) with the same probe.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+
+from loadtest.mock_upstream import MockUpstream
+
+
+PROBE = """
+import json, os, sys, time
+t0 = time.perf_counter()
+import main
+t1 = time.perf_counter()
+from config import Config
+for name, value in json.loads(os.environ["STARTUP_BENCH_OVERRIDES"]).items():
+    setattr(Config, name, value)
+get_assistant = getattr(main, "get_assistant", main.AIOpsAssistant)
+assistant = get_assistant()
+t2 = time.perf_counter()
+get_assistant()
+t3 = time.perf_counter()
+assistant.planner.create_plan("What's the weather in Paris?")
+t4 = time.perf_counter()
+print(json.dumps({
+    "import_ms": (t1 - t0) * 1000,
+    "build_ms": (t2 - t1) * 1000,
+    "new_session_ms": (t3 - t2) * 1000,
+    "first_plan_ms": (t4 - t3) * 1000,
+    "cold_start_to_plan_ms": (t4 - t0 - (t3 - t2)) * 1000,
+    "openai_loaded": "openai" in sys.modules,
+    "requests_loaded": "requests" in sys.modules
+}))
+"""
+
+
+def run(runs: int = 5, root: str = ROOT) -> None:
+    """
+    Run the startup probe in fresh interpreters and print median timings.
+
+    Args:
+        runs: Number of fresh interpreters to measure
+        root: Checkout to measure
+    """
+    upstream = MockUpstream().start()
+    env = dict(os.environ)
+    # Set on Config in the probe, as older checkouts do not read URLs from the environment
+    env["STARTUP_BENCH_OVERRIDES"] = json.dumps(upstream.config_overrides())
+    for key in ("NVIDIA_API_KEY", "WEATHER_API_KEY", "NEWS_API_KEY"):
+        env.setdefault(key, "benchmark")
+    # Measure startup, not cache lookups or background refreshes
+    env["SEMANTIC_CACHE_ENABLED"] = "false"
+
+    samples = []
+    try:
+        for _ in range(runs):
+            probe = subprocess.run(
+                [sys.executable, "-c", PROBE],
+                cwd=root, env=env, capture_output=True, text=True
+            )
+            if probe.returncode != 0:
+                raise RuntimeError(f"Startup probe failed:\n{probe.stdout}{probe.stderr}")
+            samples.append(json.loads(probe.stdout.strip().splitlines()[-1]))
+    finally:
+        upstream.stop()
+
+    for key in ("import_ms", "build_ms", "new_session_ms", "first_plan_ms", "cold_start_to_plan_ms"):
+        print(f"{key:>21}: {statistics.median(s[key] for s in samples):8.2f}")
+    print(f"{'openai_loaded':>21}: {samples[-1]['openai_loaded']}")
+    print(f"{'requests_loaded':>21}: {samples[-1]['requests_loaded']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure cold start to first plan")
+    parser.add_argument("runs", nargs="?", type=int, default=5)
+    parser.add_argument("--root", default=ROOT, help="checkout to measure")
+    args = parser.parse_args()
+    run(args.runs, os.path.abspath(args.root))
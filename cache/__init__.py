@@ -0,0 +1,12 @@
+"""Cache module for AI Operations Assistant."""
+from .result_cache import RefreshingCache
+
+__all__ = ["RefreshingCache", "SemanticCache"]
+
+
+def __getattr__(name):
+    # SemanticCache needs NumPy; import it only when asked for
+    if name == "SemanticCache":
+        from .semantic_cache import SemanticCache
+        return SemanticCache
+    raise AttributeError(name)
@@ -0,0 +1,267 @@
+"""
+Result cache for AI Operations Assistant.
+TTL cache with stale-while-revalidate: popular entries past a refresh
+threshold are served immediately while a background worker refreshes them,
+most-accessed first and within per-API rate quotas.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from config import Config
+
+
+# Longest the refresh worker sleeps before re-checking quotas
+_MAX_REFRESH_WAIT = 1.0
+
+
+class RateLimiter:
+    """Token bucket allowing a fixed number of calls per minute."""
+
+    def __init__(self, per_minute: float):
+        """
+        Initialize rate limiter.
+
+        Args:
+            per_minute: Sustained calls allowed per minute
+        """
+        self.rate = per_minute / 60.0
+        self.capacity = max(1.0, per_minute)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def consume(self) -> None:
+        """Record a call that has to happen regardless (may go into debt)."""
+        with self._lock:
+            self._refill()
+            self.tokens -= 1
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available."""
+        with self._lock:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+    def wait_time(self) -> float:
+        """Seconds until a token will be available."""
+        with self._lock:
+            self._refill()
+            if self.tokens >= 1:
+                return 0.0
+            return (1 - self.tokens) / self.rate if self.rate > 0 else float("inf")
+
+
+class _Entry:
+    """Cached value with its age, popularity and refresh loader."""
+
+    __slots__ = ("value", "fetched_at", "hits", "refreshing", "refresher", "cacheable")
+
+    def __init__(self, value: Any, refresher: Callable[[], Any],
+                 cacheable: Optional[Callable[[Any], bool]] = None):
+        self.value = value
+        self.fetched_at = time.monotonic()
+        self.hits = 0
+        self.refreshing = False
+        self.refresher = refresher
+        self.cacheable = cacheable
+
+
+class RefreshingCache:
+    """Namespaced TTL cache that refreshes hot entries in the background."""
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        quotas: Optional[Dict[str, float]] = None,
+        refresh_at: float = Config.RESULT_CACHE_REFRESH_AT,
+        min_hits: int = Config.RESULT_CACHE_MIN_HITS,
+        max_entries: int = Config.RESULT_CACHE_MAX_ENTRIES
+    ):
+        """
+        Initialize result cache.
+
+        Args:
+            ttls: Seconds an entry stays valid, per namespace
+            quotas: Upstream calls allowed per minute, per namespace
+            refresh_at: Fraction of the TTL after which hot entries are refreshed
+            min_hits: Hits an entry needs before it is refreshed in the background
+            max_entries: Maximum entries kept (least recently used are evicted)
+        """
+        self.ttls = ttls or dict(Config.RESULT_CACHE_TTLS)
+        self.limiters = {
+            namespace: RateLimiter(per_minute)
+            for namespace, per_minute in (quotas or Config.API_QUOTAS_PER_MINUTE).items()
+        }
+        self.refresh_at = refresh_at
+        self.min_hits = min_hits
+        self.max_entries = max_entries
+
+        self._entries: "OrderedDict[Tuple[str, Hashable], _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._queue = []
+        self._sequence = itertools.count()
+        self._wakeup = threading.Condition(self._lock)
+        self._worker: Optional[threading.Thread] = None
+
+        self._counts = {
+            "hits": 0, "stale_hits": 0, "misses": 0,
+            "refreshes": 0, "refresh_failures": 0
+        }
+
+    def get_or_load(
+        self,
+        namespace: str,
+        key: Hashable,
+        loader: Callable[[], Any],
+        refresher: Optional[Callable[[], Any]] = None,
+        cacheable: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """
+        Get a cached value, loading it on a miss.
+
+        Args:
+            namespace: Namespace (tool name or "plan"), selects TTL and quota
+            key: Key within the namespace
+            loader: Callable producing the value on a miss
+            refresher: Callable used for background refreshes (defaults to loader)
+            cacheable: Predicate deciding whether a loaded value may be stored
+                (values it rejects are returned but not cached)
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        ttl = self.ttls.get(namespace, 0)
+        cache_key = (namespace, key)
+
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                age = time.monotonic() - entry.fetched_at
+                if age < ttl:
+                    entry.hits += 1
+                    self._entries.move_to_end(cache_key)
+                    if (age >= ttl * self.refresh_at and entry.hits >= self.min_hits
+                            and not entry.refreshing and self._refreshable(namespace)):
+                        entry.refreshing = True
+                        self._schedule(cache_key, entry)
+                        self._counts["stale_hits"] += 1
+                    else:
+                        self._counts["hits"] += 1
+                    return entry.value
+            self._counts["misses"] += 1
+
+        limiter = self.limiters.get(namespace)
+        if limiter is not None:
+            limiter.consume()
+
+        value = loader()
+
+        if ttl > 0 and (cacheable is None or cacheable(value)):
+            with self._lock:
+                new_entry = _Entry(value, refresher or loader, cacheable)
+                if entry is not None:
+                    new_entry.hits = entry.hits
+                self._entries[cache_key] = new_entry
+                self._entries.move_to_end(cache_key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        return value
+
+    def _refreshable(self, namespace: str) -> bool:
+        """Whether a namespace's quota allows background refreshes at all."""
+        limiter = self.limiters.get(namespace)
+        return limiter is None or limiter.rate > 0
+
+    def _schedule(self, cache_key: Tuple[str, Hashable], entry: _Entry) -> None:
+        """Queue an entry for background refresh (caller holds the lock)."""
+        heapq.heappush(self._queue, (-entry.hits, next(self._sequence), cache_key))
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._refresh_loop, name="cache-refresh", daemon=True)
+            self._worker.start()
+        self._wakeup.notify()
+
+    def _next_refresh(self) -> Tuple[Optional[Tuple[str, Hashable]], float]:
+        """
+        Pop the most-accessed queued key whose namespace has quota left.
+
+        Returns:
+            (key or None, seconds to wait before retrying when None)
+        """
+        deferred = []
+        chosen = None
+        wait = _MAX_REFRESH_WAIT
+        while self._queue:
+            item = heapq.heappop(self._queue)
+            limiter = self.limiters.get(item[2][0])
+            if limiter is None or limiter.try_acquire():
+                chosen = item[2]
+                break
+            wait = min(wait, limiter.wait_time())
+            deferred.append(item)
+        for item in deferred:
+            heapq.heappush(self._queue, item)
+        return chosen, wait
+
+    def _refresh_loop(self) -> None:
+        """Background worker refreshing queued entries."""
+        while True:
+            with self._lock:
+                while not self._queue:
+                    self._wakeup.wait()
+                cache_key, wait = self._next_refresh()
+                if cache_key is None:
+                    # wait_time() is inf for an exhausted zero quota; Condition.wait rejects that
+                    self._wakeup.wait(timeout=min(max(wait, 0.0), _MAX_REFRESH_WAIT))
+                    continue
+                entry = self._entries.get(cache_key)
+
+            if entry is None:
+                continue
+
+            try:
+                value = entry.refresher()
+                if entry.cacheable is not None and not entry.cacheable(value):
+                    raise ValueError("refreshed value is not cacheable")
+            except Exception as e:
+                print(f"[Cache] Background refresh failed for {cache_key}: {e}")
+                with self._lock:
+                    entry.refreshing = False
+                    self._counts["refresh_failures"] += 1
+                continue
+
+            with self._lock:
+                entry.value = value
+                entry.fetched_at = time.monotonic()
+                entry.refreshing = False
+                self._counts["refreshes"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss/refresh counts, hit ratio, size and queue length
+        """
+        with self._lock:
+            stats = dict(self._counts)
+            stats["size"] = len(self._entries)
+            stats["refresh_queue"] = len(self._queue)
+
+        served = stats["hits"] + stats["stale_hits"]
+        lookups = served + stats["misses"]
+        stats["hit_ratio"] = served / lookups if lookups else 0.0
+        return stats
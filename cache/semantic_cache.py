@@ -0,0 +1,302 @@
+"""
+Semantic cache for AI Operations Assistant.
+Reuses stored values (e.g. plans) for paraphrased task text using hashed
+n-gram vectors kept in a NumPy index.
+"""
+
+import copy
+import re
+import threading
+import time
+import zlib
+from collections import deque
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+
+from config import Config
+
+
+# Function words that carry no meaning for plan selection
+_STOPWORDS = frozenset({
+    "a", "an", "and", "the", "of", "in", "on", "at", "for", "to", "from",
+    "with", "about", "is", "are", "what", "whats", "s", "me", "my", "please",
+    "like", "show", "tell", "give", "now", "right", "today", "current",
+    "currently", "latest", "recent", "new", "newest", "also", "some", "any",
+    "how", "it", "its", "there", "be", "do", "does", "can", "you", "i"
+})
+
+# Words that describe intent (which tool to use) rather than an entity
+_INTENT_WORDS = frozenset({
+    "weather", "temperature", "forecast", "conditions", "condition",
+    "news", "headlines", "headline", "articles", "article", "stories",
+    "github", "repo", "repos", "repository", "repositories", "project",
+    "projects", "code", "find", "get", "fetch", "search", "look", "lookup",
+    "top", "best", "popular", "most", "starred", "stars", "check"
+})
+
+# Intent words that name a tool; the requested tool set must match exactly
+_TOOL_INTENTS = {
+    "weather": "weather_fetch", "temperature": "weather_fetch", "forecast": "weather_fetch",
+    "conditions": "weather_fetch", "condition": "weather_fetch",
+    "news": "news_fetch", "headlines": "news_fetch", "headline": "news_fetch",
+    "articles": "news_fetch", "article": "news_fetch", "stories": "news_fetch",
+    "github": "github_search", "repo": "github_search", "repos": "github_search",
+    "repository": "github_search", "repositories": "github_search",
+    "project": "github_search", "projects": "github_search", "code": "github_search",
+    "starred": "github_search", "stars": "github_search"
+}
+
+# Stopwords that start multi-word place names ("new york", "new delhi")
+_NAME_PREFIXES = frozenset({"new"})
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9#+]+")
+_RAW_TOKEN_PATTERN = re.compile(r"[A-Za-z0-9#+]+")
+
+
+def _tokenize(text: str) -> List[str]:
+    """Split text into lowercase content tokens (stopwords removed)."""
+    return [t for t in _TOKEN_PATTERN.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def _is_capitalized(token: str) -> bool:
+    return token[0].isupper()
+
+
+def _stopword_is_entity(tokens: List[str], i: int) -> bool:
+    """
+    Decide whether a stopword is part of an entity, from its original casing.
+
+    Acronyms ("IT", "US") and words inside a capitalized span ("New York")
+    are entities; so is a name prefix followed by a content word ("new york").
+    """
+    token = tokens[i]
+    if len(token) > 1 and token.isupper():
+        return True
+    if _is_capitalized(token):
+        neighbours = tokens[max(0, i - 1):i] + tokens[i + 1:i + 2]
+        if any(_is_capitalized(n) for n in neighbours):
+            return True
+    if token.lower() in _NAME_PREFIXES and i + 1 < len(tokens):
+        following = tokens[i + 1].lower()
+        return following not in _STOPWORDS and following not in _INTENT_WORDS
+    return False
+
+
+def extract_entities(text: str) -> FrozenSet[str]:
+    """
+    Extract the entity tokens of a task (cities, search terms, topics).
+
+    Works on the raw tokens so that stopwords which are part of a name
+    ("New York", "IT news") are kept rather than dropped.
+
+    Args:
+        text: Natural language task
+
+    Returns:
+        Frozen set of lowercase tokens that must match exactly for a cache hit
+    """
+    tokens = _RAW_TOKEN_PATTERN.findall(text)
+    entities = set()
+    for i, token in enumerate(tokens):
+        word = token.lower()
+        if word in _INTENT_WORDS:
+            continue
+        if word not in _STOPWORDS or _stopword_is_entity(tokens, i):
+            entities.add(word)
+    return frozenset(entities)
+
+
+def extract_tool_intents(text: str) -> FrozenSet[str]:
+    """
+    Extract the tools a task asks for from its intent words.
+
+    Args:
+        text: Natural language task
+
+    Returns:
+        Frozen set of tool names ("weather_fetch", "news_fetch", "github_search")
+    """
+    return frozenset(
+        _TOOL_INTENTS[t] for t in _TOKEN_PATTERN.findall(text.lower()) if t in _TOOL_INTENTS
+    )
+
+
+def _match_key(text: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """Entities and requested tools; both must match exactly for a hit."""
+    return extract_entities(text), extract_tool_intents(text)
+
+
+class SemanticCache:
+    """Approximate-match cache keyed by task text similarity."""
+
+    def __init__(
+        self,
+        threshold: float = Config.SEMANTIC_CACHE_THRESHOLD,
+        dim: int = Config.SEMANTIC_CACHE_DIM,
+        max_entries: int = Config.SEMANTIC_CACHE_MAX_ENTRIES,
+        ngram_size: int = 3
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a hit (0-1)
+            dim: Dimension of the hashed n-gram vectors
+            max_entries: Maximum entries kept; oldest are overwritten first
+            ngram_size: Character n-gram size used for the vectors
+        """
+        self.threshold = threshold
+        self.dim = dim
+        self.max_entries = max_entries
+        self.ngram_size = ngram_size
+
+        self._vectors = np.zeros((min(1024, max_entries), dim), dtype=np.float32)
+        self._keys: List[Tuple[FrozenSet[str], FrozenSet[str]]] = []
+        self._values: List[Any] = []
+        self._texts: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._size = 0
+        self._next = 0
+        self._lock = threading.Lock()
+
+        self._lookups = 0
+        self._hits = 0
+        self._latencies = deque(maxlen=1000)
+
+    def embed(self, text: str) -> np.ndarray:
+        """
+        Compute a normalized hashed n-gram vector for text.
+
+        Word unigrams and per-word character n-grams are hashed into
+        `dim` buckets with a sign bit, so the vector does not depend on
+        word order ("Mumbai weather" == "weather in Mumbai").
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            L2-normalized float32 vector of length `dim`
+        """
+        vector = np.zeros(self.dim, dtype=np.float32)
+        n = self.ngram_size
+
+        for token in _tokenize(text):
+            features = [f"w:{token}"]
+            padded = f" {token} "
+            features.extend(padded[i:i + n] for i in range(max(1, len(padded) - n + 1)))
+
+            for feature in features:
+                h = zlib.crc32(feature.encode("utf-8"))
+                vector[h % self.dim] += 1.0 if (h >> 31) & 1 else -1.0
+
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+
+    def get(self, text: str) -> Optional[Tuple[Any, float]]:
+        """
+        Look up a value stored for similar text.
+
+        Args:
+            text: Task text to look up
+
+        Returns:
+            Tuple of (copy of stored value, similarity) or None on miss
+        """
+        start = time.perf_counter()
+        query = self.embed(text)
+        key = _match_key(text)
+        result = None
+
+        with self._lock:
+            self._lookups += 1
+
+            if self._size:
+                scores = self._vectors[:self._size] @ query
+                candidates = np.flatnonzero(scores >= self.threshold)
+
+                # Best score first; entities and requested tools must still match exactly
+                for idx in candidates[np.argsort(-scores[candidates])]:
+                    if self._keys[idx] == key:
+                        result = (copy.deepcopy(self._values[idx]), float(scores[idx]))
+                        self._hits += 1
+                        break
+
+            self._latencies.append(time.perf_counter() - start)
+
+        return result
+
+    def put(self, text: str, value: Any) -> None:
+        """
+        Store a value for text, replacing any value stored for the same text.
+
+        Args:
+            text: Task text
+            value: Value to store (copied)
+        """
+        vector = self.embed(text)
+        key = _match_key(text)
+        value = copy.deepcopy(value)
+        normalized = " ".join(text.lower().split())
+
+        with self._lock:
+            idx = self._rows.get(normalized)
+            if idx is not None:
+                # Same text stored again (e.g. a background refresh): overwrite its row
+                self._values[idx] = value
+                return
+
+            if self._size < self.max_entries:
+                if self._size == len(self._vectors):
+                    grown = np.zeros(
+                        (min(len(self._vectors) * 2, self.max_entries), self.dim),
+                        dtype=np.float32
+                    )
+                    grown[:self._size] = self._vectors[:self._size]
+                    self._vectors = grown
+
+                idx = self._size
+                self._keys.append(key)
+                self._values.append(value)
+                self._texts.append(normalized)
+                self._size += 1
+            else:
+                # Index is full: overwrite the oldest entry
+                idx = self._next
+                del self._rows[self._texts[idx]]
+                self._keys[idx] = key
+                self._values[idx] = value
+                self._texts[idx] = normalized
+                self._next = (self._next + 1) % self.max_entries
+
+            self._rows[normalized] = idx
+            self._vectors[idx] = vector
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, lookups, hits, hit rate and lookup latency
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+            lookups = self._lookups
+            hits = self._hits
+            size = self._size
+
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+        return {
+            "size": size,
+            "lookups": lookups,
+            "hits": hits,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "lookup_p50_ms": percentile(0.50),
+            "lookup_p95_ms": percentile(0.95)
+        }
@@ -18,13 +18,13 @@ class Config:
     NEWS_API_KEY = os.getenv("NEWS_API_KEY")
     
     # NVIDIA API Settings
-    NVIDIA_BASE_URL = "https://integrate.api.nvidia.com/v1"
+    NVIDIA_BASE_URL = os.getenv("NVIDIA_BASE_URL", "https://integrate.api.nvidia.com/v1")
     NVIDIA_MODEL = os.getenv("NVIDIA_MODEL", "meta/llama-3.1-8b-instruct")
     
     # API Endpoints
-    GITHUB_API_URL = "https://api.github.com/search/repositories"
-    WEATHER_API_URL = "http://api.weatherapi.com/v1/current.json"
-    NEWS_API_URL = "https://newsapi.org/v2/everything"
+    GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com/search/repositories")
+    WEATHER_API_URL = os.getenv("WEATHER_API_URL", "http://api.weatherapi.com/v1/current.json")
+    NEWS_API_URL = os.getenv("NEWS_API_URL", "https://newsapi.org/v2/everything")
     
     # Retry Settings
     MAX_RETRIES = 3
@@ -33,6 +33,72 @@ class Config:
     # LLM Settings
     DEFAULT_TEMPERATURE = 0
     DEFAULT_MAX_TOKENS = 1000
+    JSON_REASK_MAX_TOKENS = 500
+    # Ask streamed responses for token usage; disable for endpoints that reject stream_options
+    LLM_STREAM_USAGE = os.getenv("LLM_STREAM_USAGE", "true").lower() == "true"
+    
+    # Model Routing Settings
+    PLANNER_MODEL = os.getenv("PLANNER_MODEL", NVIDIA_MODEL)
+    VERIFIER_MODEL = os.getenv("VERIFIER_MODEL", NVIDIA_MODEL)
+    HEDGE_MODEL = os.getenv("HEDGE_MODEL")
+    HEDGE_BASE_URL = os.getenv("HEDGE_BASE_URL", NVIDIA_BASE_URL)
+    HEDGE_PERCENTILE = 95
+    HEDGE_MIN_SAMPLES = 20
+    HEDGE_DEFAULT_DELAY = float(os.getenv("HEDGE_DEFAULT_DELAY", "3.0"))
+    HEDGE_POOL_SIZE = 16
+    LATENCY_WINDOW = 200
+    
+    # Result Cache Settings (stale-while-revalidate)
+    RESULT_CACHE_ENABLED = os.getenv("RESULT_CACHE_ENABLED", "true").lower() == "true"
+    RESULT_CACHE_TTLS = {
+        "weather_fetch": 600,
+        "github_search": 3600,
+        "news_fetch": 900,
+        "plan": 86400
+    }
+    RESULT_CACHE_REFRESH_AT = 0.8
+    RESULT_CACHE_MIN_HITS = 2
+    RESULT_CACHE_MAX_ENTRIES = 10000
+    
+    # Upstream calls allowed per minute (background refreshes stay within these)
+    API_QUOTAS_PER_MINUTE = {
+        "github_search": 10,
+        "weather_fetch": 20,
+        "news_fetch": 0.07,
+        "plan": 30
+    }
+    
+    # News Ranking Settings
+    NEWS_FETCH_POOL_SIZE = int(os.getenv("NEWS_FETCH_POOL_SIZE", "50"))
+    NEWS_RECENCY_HALF_LIFE_HOURS = 24.0
+    NEWS_SOURCE_PENALTY = 0.5
+    
+    # Plan Merging Settings
+    PLAN_MERGE_ENABLED = os.getenv("PLAN_MERGE_ENABLED", "false").lower() == "true"
+    PLAN_MERGE_WINDOW_MS = float(os.getenv("PLAN_MERGE_WINDOW_MS", "50"))
+    
+    # Verifier Settings (per-step summaries reused across tasks)
+    VERIFIER_CACHE_SIZE = int(os.getenv("VERIFIER_CACHE_SIZE", "1000"))
+    
+    # Metrics Settings (Prometheus text format at /metrics)
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false").lower() == "true"
+    METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+    METRICS_PORT = int(os.getenv("METRICS_PORT", "9108"))
+    
+    # Profiling Settings
+    PROFILE_ENABLED = os.getenv("PROFILE_ENABLED", "false").lower() == "true"
+    PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+    PROFILE_SAMPLE_INTERVAL = 0.005
+    
+    # Worker Pool Settings
+    WORKER_PROCESSES = int(os.getenv("WORKER_PROCESSES", "0"))
+    
+    # Plan Cache Settings
+    SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "true").lower() == "true"
+    SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.85"))
+    SEMANTIC_CACHE_DIM = 256
+    # Each entry holds a DIM float32 vector (1 KB at 256), per process
+    SEMANTIC_CACHE_MAX_ENTRIES = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "20000"))
     
     @classmethod
     def validate(cls) -> bool:
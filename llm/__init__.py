@@ -1,4 +1,5 @@
 """LLM module for AI Operations Assistant."""
 from .openrouter_client import OpenRouterClient
+from .router import ModelRouter, RoutedLLMClient
 
-__all__ = ["OpenRouterClient"]
+__all__ = ["OpenRouterClient", "ModelRouter", "RoutedLLMClient"]
@@ -0,0 +1,217 @@
+"""
+Incremental JSON extraction for AI Operations Assistant.
+Finds the first complete JSON object in streamed LLM output and repairs
+truncated output by dropping incomplete trailing members.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Maximum number of trailing members dropped while repairing truncated JSON
+MAX_REPAIR_TRIMS = 50
+
+
+class RepairedJSON(dict):
+    """
+    Object recovered from truncated output.
+
+    Trailing members may be missing, so callers should validate it and
+    must not cache anything derived from it.
+    """
+
+
+def _scan_members(text: str) -> Tuple[List[int], bool]:
+    """
+    Find member boundaries of a JSON prefix.
+
+    Returns:
+        (positions of commas outside strings, whether the text ends inside a string)
+    """
+    commas: List[int] = []
+    in_string = False
+    escape = False
+
+    for i, ch in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == ",":
+            commas.append(i)
+
+    return commas, in_string
+
+
+def _close_truncated(prefix: str) -> str:
+    """Close the open objects and arrays of a prefix that ends between members."""
+    stack: List[str] = []
+    in_string = False
+    escape = False
+
+    for ch in prefix:
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append(ch)
+        elif ch in "}]" and stack:
+            stack.pop()
+
+    return prefix.rstrip() + "".join("}" if c == "{" else "]" for c in reversed(stack))
+
+
+def repair_truncated_json(text: str) -> Optional[RepairedJSON]:
+    """
+    Repair a truncated JSON object by dropping its incomplete tail.
+
+    Cut-off values are never completed: an open string, a number or a
+    literal at the end may be truncated ("Mum" of "Mumbai"), so the text
+    is only closed as-is when it ends on a finished string or container.
+    Otherwise trailing members are dropped, one comma at a time, until
+    what is left closes into a valid object.
+
+    Args:
+        text: JSON text starting with '{' that was cut off
+
+    Returns:
+        Repaired object (possibly missing trailing members), or None
+    """
+    commas, in_string = _scan_members(text)
+
+    cuts = []
+    stripped = text.rstrip()
+    if not in_string and stripped.endswith(("}", "]", '"')):
+        cuts.append(len(stripped))
+    cuts.extend(reversed(commas))
+
+    for cut in cuts[:MAX_REPAIR_TRIMS]:
+        try:
+            parsed = json.loads(_close_truncated(text[:cut]))
+        except json.JSONDecodeError:
+            continue
+        if isinstance(parsed, dict):
+            return RepairedJSON(parsed)
+
+    return None
+
+
+class IncrementalJSONExtractor:
+    """Extracts the first complete JSON object from text as it arrives."""
+
+    def __init__(self):
+        """Initialize extractor state."""
+        self.buffer = ""
+        self.result: Optional[Dict[str, Any]] = None
+        self.start = -1
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    @property
+    def done(self) -> bool:
+        """Whether a complete object has been parsed."""
+        return self.result is not None
+
+    @property
+    def had_prose(self) -> bool:
+        """Whether non-whitespace text (prose, fences) preceded the object."""
+        return self.start > 0 and bool(self.buffer[:self.start].strip())
+
+    def feed(self, chunk: str) -> Optional[Dict[str, Any]]:
+        """
+        Feed the next chunk of streamed text.
+
+        Args:
+            chunk: Newly received text
+
+        Returns:
+            Parsed object once the first complete one is seen, else None
+        """
+        if self.done:
+            return self.result
+
+        self.buffer += chunk
+
+        while self._pos < len(self.buffer):
+            ch = self.buffer[self._pos]
+            self._pos += 1
+
+            if self.start < 0:
+                if ch == "{":
+                    self.start = self._pos - 1
+                    self._depth = 1
+                    self._in_string = False
+                    self._escape = False
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        parsed = json.loads(self.buffer[self.start:self._pos])
+                        if isinstance(parsed, dict):
+                            self.result = parsed
+                            return parsed
+                    except json.JSONDecodeError:
+                        pass
+                    # Balanced but invalid (e.g. "{note}" in prose): keep scanning
+                    self._pos = self.start + 1
+                    self.start = -1
+
+        return None
+
+    def partial_text(self) -> str:
+        """Text of the object seen so far (empty if no object started)."""
+        return self.buffer[self.start:] if self.start >= 0 else ""
+
+    def repair(self) -> Optional[Dict[str, Any]]:
+        """
+        Attempt to repair the object seen so far.
+
+        Returns:
+            Repaired object (a RepairedJSON), the result if complete,
+            or None if nothing usable was received
+        """
+        if self.done:
+            return self.result
+        if self.start < 0:
+            return None
+        return repair_truncated_json(self.partial_text())
+
+
+def extract_json(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Extract the first JSON object from text, repairing truncation if needed.
+
+    Args:
+        text: Raw LLM output (may contain prose or Markdown fences)
+
+    Returns:
+        Parsed object or None
+    """
+    extractor = IncrementalJSONExtractor()
+    return extractor.feed(text) or extractor.repair()
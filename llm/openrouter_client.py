@@ -4,40 +4,78 @@ Handles chat completions using NVIDIA's API with retry logic and error handling.
 """
 
 import time
-import json
-from typing import List, Dict, Any, Optional
-from openai import OpenAI
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from config import Config
+from llm.json_extractor import IncrementalJSONExtractor
+from metrics import LLM_REQUESTS, LLM_RETRIES, LLM_SECONDS, LLM_TOKENS
+
+
+REASK_PROMPT = (
+    "Your previous response was cut off or was not valid JSON. "
+    "Output ONLY the remaining characters needed to complete the JSON object, "
+    "starting exactly where it stopped. No prose, no code fences."
+)
+
+REASK_FULL_PROMPT = "Output ONLY the JSON object requested above. No prose, no code fences."
 
 
 class OpenRouterClient:
     """Client for interacting with NVIDIA API using OpenAI SDK."""
     
-    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: Optional[str] = None,
+        base_url: Optional[str] = None
+    ):
         """
         Initialize NVIDIA client.
         
         Args:
             api_key: NVIDIA API key (defaults to config)
-            model: Model name (defaults to config)
+            model: Default model name (defaults to config)
+            base_url: API endpoint (defaults to config)
         """
         self.api_key = api_key or Config.NVIDIA_API_KEY
         self.model = model or Config.NVIDIA_MODEL
-        self.base_url = Config.NVIDIA_BASE_URL
+        self.base_url = base_url or Config.NVIDIA_BASE_URL
         self.max_retries = Config.MAX_RETRIES
         self.retry_delay = Config.RETRY_DELAY
         
-        self.client = OpenAI(
-            base_url=self.base_url,
-            api_key=self.api_key
-        )
+        self._client = None
+        self._client_lock = threading.Lock()
+        
+        self._stats_lock = threading.Lock()
+        self.json_stats = {
+            "calls": 0,
+            "direct": 0,
+            "extracted": 0,
+            "repaired": 0,
+            "reasked": 0,
+            "failed": 0
+        }
+    
+    @property
+    def client(self):
+        """OpenAI SDK client, created (and the SDK imported) on first use."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    from openai import OpenAI
+                    self._client = OpenAI(
+                        base_url=self.base_url,
+                        api_key=self.api_key
+                    )
+        return self._client
     
     def call_llm(
         self,
         messages: List[Dict[str, str]],
         temperature: float = Config.DEFAULT_TEMPERATURE,
         max_tokens: int = Config.DEFAULT_MAX_TOKENS,
-        json_mode: bool = False
+        json_mode: bool = False,
+        model: Optional[str] = None
     ) -> str:
         """
         Call the LLM with given messages.
@@ -47,54 +85,305 @@ class OpenRouterClient:
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
             json_mode: If True, request JSON response
+            model: Model override for this call (defaults to client model)
             
         Returns:
             LLM response content as string
         """
+        model = model or self.model
         for attempt in range(self.max_retries):
+            LLM_REQUESTS.inc(model=model, mode="complete")
+            start = time.perf_counter()
             try:
                 completion = self.client.chat.completions.create(
-                    model=self.model,
+                    model=model,
                     messages=messages,
                     temperature=temperature,
                     max_tokens=max_tokens,
                     stream=False
                 )
                 
+                LLM_SECONDS.observe(time.perf_counter() - start, model=model)
+                usage = getattr(completion, "usage", None)
+                if usage is not None:
+                    LLM_TOKENS.inc(usage.prompt_tokens or 0, model=model, kind="prompt")
+                    LLM_TOKENS.inc(usage.completion_tokens or 0, model=model, kind="completion")
+                
                 content = completion.choices[0].message.content
                 return content
                 
             except Exception as e:
                 if attempt < self.max_retries - 1:
+                    LLM_RETRIES.inc(model=model)
+                    print(f"API call failed (attempt {attempt + 1}/{self.max_retries}): {e}")
+                    print(f"Retrying in {self.retry_delay} seconds...")
+                    time.sleep(self.retry_delay)
+                else:
+                    raise RuntimeError(f"Failed to call LLM after {self.max_retries} attempts: {e}")
+    
+    def _stream_into(
+        self,
+        messages: List[Dict[str, str]],
+        extractor: IncrementalJSONExtractor,
+        temperature: float,
+        max_tokens: int,
+        model: Optional[str] = None
+    ) -> None:
+        """
+        Stream a completion into a JSON extractor, stopping at the first complete object.
+        
+        Retries only while no content has arrived; a stream that breaks
+        partway through is left truncated for the caller to repair. Token
+        usage is requested with the stream (LLM_STREAM_USAGE) and sent in its
+        final chunk, so after an early stop the rest is read in the background.
+        
+        Args:
+            messages: List of message dicts
+            extractor: Extractor receiving the streamed text
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            model: Model override for this call
+        """
+        model = model or self.model
+        extra = {"stream_options": {"include_usage": True}} if Config.LLM_STREAM_USAGE else {}
+        for attempt in range(self.max_retries):
+            received = False
+            complete = False
+            chunks = 0
+            usage = None
+            LLM_REQUESTS.inc(model=model, mode="stream")
+            start = time.perf_counter()
+            try:
+                stream = self.client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stream=True,
+                    **extra
+                )
+                
+                try:
+                    for chunk in stream:
+                        usage = getattr(chunk, "usage", None) or usage
+                        if not chunk.choices:
+                            continue
+                        delta = chunk.choices[0].delta.content
+                        if delta:
+                            received = True
+                            chunks += 1
+                            if extractor.feed(delta) is not None:
+                                complete = True
+                                break
+                finally:
+                    if complete and extra:
+                        # Usage arrives in the final chunk: read the rest in the background
+                        threading.Thread(
+                            target=self._drain_usage, args=(stream, model, chunks),
+                            name="llm-usage-drain", daemon=True
+                        ).start()
+                    else:
+                        stream.close()
+                        self._record_stream_usage(model, usage, chunks)
+                LLM_SECONDS.observe(time.perf_counter() - start, model=model)
+                return
+                
+            except Exception as e:
+                if received:
+                    print(f"LLM stream interrupted: {e}")
+                    return
+                if attempt < self.max_retries - 1:
+                    LLM_RETRIES.inc(model=model)
                     print(f"API call failed (attempt {attempt + 1}/{self.max_retries}): {e}")
                     print(f"Retrying in {self.retry_delay} seconds...")
                     time.sleep(self.retry_delay)
                 else:
                     raise RuntimeError(f"Failed to call LLM after {self.max_retries} attempts: {e}")
     
+    def _drain_usage(self, stream: Any, model: str, chunks: int) -> None:
+        """Read a stream to its end for the usage chunk, then record token counts."""
+        usage = None
+        try:
+            for chunk in stream:
+                usage = getattr(chunk, "usage", None) or usage
+                if chunk.choices and chunk.choices[0].delta.content:
+                    chunks += 1
+        except Exception:
+            pass
+        finally:
+            stream.close()
+        self._record_stream_usage(model, usage, chunks)
+    
+    @staticmethod
+    def _record_stream_usage(model: str, usage: Any, chunks: int) -> None:
+        """Record reported token usage, or the chunk count if none was reported."""
+        if usage is not None:
+            LLM_TOKENS.inc(usage.prompt_tokens or 0, model=model, kind="prompt")
+            LLM_TOKENS.inc(usage.completion_tokens or 0, model=model, kind="completion")
+        else:
+            LLM_TOKENS.inc(chunks, model=model, kind="completion_chunks")
+    
+    def record_json_outcome(self, outcome: str) -> None:
+        """Count the outcome of a JSON call."""
+        with self._stats_lock:
+            self.json_stats["calls"] += 1
+            self.json_stats[outcome] += 1
+    
+    def json_parse_stats(self) -> Dict[str, Any]:
+        """
+        Get JSON parsing statistics.
+        
+        Returns:
+            Outcome counts plus rates: raw_failure_rate (plain json.loads would
+            have failed), reask_rate (extra LLM round trip) and failure_rate
+        """
+        with self._stats_lock:
+            stats = dict(self.json_stats)
+        
+        calls = stats["calls"]
+        stats["raw_failure_rate"] = (calls - stats["direct"]) / calls if calls else 0.0
+        stats["reask_rate"] = stats["reasked"] / calls if calls else 0.0
+        stats["failure_rate"] = stats["failed"] / calls if calls else 0.0
+        return stats
+    
+    def _reask(
+        self,
+        messages: List[Dict[str, str]],
+        extractor: IncrementalJSONExtractor,
+        temperature: float,
+        model: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Ask the LLM for only the missing part of a malformed JSON response.
+        
+        Args:
+            messages: Original message list
+            extractor: Extractor holding the partial response
+            temperature: Sampling temperature
+            model: Model override for this call
+            
+        Returns:
+            Completed object, or None if it still cannot be parsed
+        """
+        partial = extractor.partial_text()
+        if partial:
+            followup = [
+                {"role": "assistant", "content": partial},
+                {"role": "user", "content": REASK_PROMPT}
+            ]
+        else:
+            followup = [
+                {"role": "assistant", "content": extractor.buffer},
+                {"role": "user", "content": REASK_FULL_PROMPT}
+            ]
+        
+        continuation = self.call_llm(
+            messages + followup,
+            temperature,
+            Config.JSON_REASK_MAX_TOKENS,
+            model=model
+        )
+        
+        # The model may restart the object instead of continuing it
+        fresh = IncrementalJSONExtractor()
+        if fresh.feed(continuation) is not None:
+            return fresh.result
+        
+        return extractor.feed(continuation) or extractor.repair()
+    
     def call_llm_with_json(
         self,
         messages: List[Dict[str, str]],
         temperature: float = Config.DEFAULT_TEMPERATURE,
-        max_tokens: int = Config.DEFAULT_MAX_TOKENS
+        max_tokens: int = Config.DEFAULT_MAX_TOKENS,
+        model: Optional[str] = None,
+        validate: Optional[Callable[[Dict[str, Any]], None]] = None
     ) -> Dict[str, Any]:
         """
         Call LLM and parse JSON response safely.
         
+        The response is streamed and the first complete JSON object is
+        returned as soon as it closes, even if wrapped in prose or Markdown
+        fences. Truncated output is repaired locally by dropping incomplete
+        members; if the repaired object fails validation, the LLM is re-asked
+        for the missing part. Repaired objects are returned as RepairedJSON so
+        callers can avoid caching them.
+        
         Args:
             messages: List of message dicts
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
+            model: Model override for this call (defaults to client model)
+            validate: Optional check raising ValueError for an unusable object
             
         Returns:
-            Parsed JSON object
+            Parsed JSON object (a RepairedJSON if recovered from truncated output)
             
         Raises:
-            ValueError: If response cannot be parsed as JSON
+            ValueError: If response cannot be parsed as JSON or fails validation
         """
-        response = self.call_llm(messages, temperature, max_tokens, json_mode=True)
+        try:
+            result, outcome = self.call_llm_with_json_outcome(
+                messages, temperature, max_tokens, model=model, validate=validate
+            )
+        except ValueError:
+            self.record_json_outcome("failed")
+            raise
+        self.record_json_outcome(outcome)
+        return result
+    
+    def call_llm_with_json_outcome(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = Config.DEFAULT_TEMPERATURE,
+        max_tokens: int = Config.DEFAULT_MAX_TOKENS,
+        model: Optional[str] = None,
+        validate: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Tuple[Dict[str, Any], str]:
+        """
+        Same as call_llm_with_json, without counting the outcome.
+        
+        Lets callers that race several calls (hedging) count only the one
+        whose result is used.
+        
+        Returns:
+            Parsed JSON object and its parse outcome ("direct", "extracted",
+            "repaired" or "reasked")
+            
+        Raises:
+            ValueError: If response cannot be parsed as JSON or fails validation
+        """
+        extractor = IncrementalJSONExtractor()
+        self._stream_into(messages, extractor, temperature, max_tokens, model)
+        
+        if extractor.done:
+            self._validate(extractor.result, validate)
+            return extractor.result, "extracted" if extractor.had_prose else "direct"
+        
+        repaired = extractor.repair()
+        if repaired is not None and self._is_valid(repaired, validate):
+            return repaired, "repaired"
         
         try:
-            return json.loads(response)
-        except json.JSONDecodeError:
-            raise ValueError(f"LLM response is not valid JSON: {response}")
+            completed = self._reask(messages, extractor, temperature, model)
+        except RuntimeError:
+            completed = None
+        
+        if completed is not None and self._is_valid(completed, validate):
+            return completed, "reasked"
+        
+        raise ValueError(f"LLM response is not valid JSON: {extractor.buffer}")
+    
+    @staticmethod
+    def _validate(obj: Dict[str, Any], validate: Optional[Callable[[Dict[str, Any]], None]]) -> None:
+        """Run the caller's validation, if any (raises ValueError)."""
+        if validate is not None:
+            validate(obj)
+    
+    def _is_valid(self, obj: Dict[str, Any], validate: Optional[Callable[[Dict[str, Any]], None]]) -> bool:
+        """Whether an object passes the caller's validation."""
+        try:
+            self._validate(obj, validate)
+            return True
+        except ValueError:
+            return False
@@ -0,0 +1,284 @@
+"""
+Model router for AI Operations Assistant.
+Routes each agent to a model tier and hedges slow LLM requests with a
+duplicate call to a second model or endpoint.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Optional
+
+from config import Config
+from llm.openrouter_client import OpenRouterClient
+
+
+class LatencyTracker:
+    """Tracks recent successful call latencies per model."""
+
+    def __init__(self, window: int = Config.LATENCY_WINDOW):
+        """
+        Initialize latency tracker.
+
+        Args:
+            window: Number of recent samples kept per model
+        """
+        self.window = window
+        self._samples: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def record(self, model: str, seconds: float) -> None:
+        """Record one call latency for a model."""
+        with self._lock:
+            self._samples.setdefault(model, deque(maxlen=self.window)).append(seconds)
+
+    def count(self, model: str) -> int:
+        """Number of samples currently kept for a model."""
+        with self._lock:
+            return len(self._samples.get(model, ()))
+
+    def percentile(self, model: str, pct: float) -> Optional[float]:
+        """
+        Get a latency percentile for a model.
+
+        Args:
+            model: Model key
+            pct: Percentile (0-100)
+
+        Returns:
+            Latency in seconds, or None if no samples
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(model, ()))
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(pct / 100 * len(samples)))]
+
+    def models(self) -> List[str]:
+        """Models with recorded samples."""
+        with self._lock:
+            return list(self._samples)
+
+
+class ModelRouter:
+    """Routes LLM calls to per-agent model tiers with optional hedging."""
+
+    def __init__(
+        self,
+        client: OpenRouterClient,
+        hedge_client: Optional[OpenRouterClient] = None,
+        tiers: Optional[Dict[str, str]] = None,
+        hedge_model: Optional[str] = Config.HEDGE_MODEL
+    ):
+        """
+        Initialize model router.
+
+        Args:
+            client: Primary LLM client
+            hedge_client: Client for hedged calls (defaults to one for HEDGE_BASE_URL)
+            tiers: Mapping of tier name to model (defaults to config)
+            hedge_model: Model used for hedged calls; None disables hedging
+        """
+        self.client = client
+        self.tiers = tiers or {
+            "planner": Config.PLANNER_MODEL,
+            "verifier": Config.VERIFIER_MODEL
+        }
+        self.hedge_model = hedge_model
+        self.hedge_client = hedge_client
+        if hedge_model and hedge_client is None:
+            self.hedge_client = (
+                client if Config.HEDGE_BASE_URL == client.base_url
+                else OpenRouterClient(model=hedge_model, base_url=Config.HEDGE_BASE_URL)
+            )
+
+        self.latency = LatencyTracker()
+        # Only hedges are pooled (bounding the extra load); primaries get their own thread
+        self._hedge_pool = ThreadPoolExecutor(
+            max_workers=Config.HEDGE_POOL_SIZE,
+            thread_name_prefix="llm-hedge"
+        ) if hedge_model else None
+        self._stats_lock = threading.Lock()
+        self.hedge_stats = {"calls": 0, "hedged": 0, "hedge_wins": 0}
+
+    def for_tier(self, tier: str) -> "RoutedLLMClient":
+        """
+        Get a client bound to a model tier.
+
+        Args:
+            tier: Tier name (e.g. "planner", "verifier")
+
+        Returns:
+            Client exposing the OpenRouterClient call interface
+        """
+        return RoutedLLMClient(self, tier)
+
+    def model_for(self, tier: str) -> str:
+        """Model configured for a tier."""
+        return self.tiers.get(tier, self.client.model)
+
+    def _key(self, client: OpenRouterClient, model: str) -> str:
+        """Latency tracking key for a model on an endpoint."""
+        if client.base_url == self.client.base_url:
+            return model
+        return f"{model}@{client.base_url}"
+
+    def hedge_delay(self, key: str) -> float:
+        """
+        Time to wait for the primary call before sending a hedge.
+
+        Uses the tracked latency percentile once enough samples exist,
+        otherwise the configured default.
+
+        Args:
+            key: Latency tracking key of the primary model
+
+        Returns:
+            Delay in seconds
+        """
+        if self.latency.count(key) >= Config.HEDGE_MIN_SAMPLES:
+            return self.latency.percentile(key, Config.HEDGE_PERCENTILE)
+        return Config.HEDGE_DEFAULT_DELAY
+
+    def _timed(self, client: OpenRouterClient, model: str, method: str, args, kwargs) -> Any:
+        """Run one client call and record its latency on success."""
+        start = time.perf_counter()
+        result = getattr(client, method)(*args, model=model, **kwargs)
+        self.latency.record(self._key(client, model), time.perf_counter() - start)
+        return result
+
+    @staticmethod
+    def _start(fn, *args) -> Future:
+        """Run a call on its own daemon thread, so no pool limits primary calls."""
+        future: Future = Future()
+        
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+        
+        threading.Thread(target=run, name="llm-primary", daemon=True).start()
+        return future
+
+    def call(self, tier: str, method: str, *args, **kwargs) -> Any:
+        """
+        Call a client method on the tier's model, hedging if it is slow.
+
+        The hedge delay is measured from the start of the primary call. For
+        JSON calls only the outcome of the call whose result is used is
+        counted in the primary client's JSON statistics.
+
+        Args:
+            tier: Tier name
+            method: OpenRouterClient method name
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+
+        Returns:
+            Result of whichever call finished successfully first
+        """
+        model = self.model_for(tier)
+
+        with self._stats_lock:
+            self.hedge_stats["calls"] += 1
+
+        if self._hedge_pool is None:
+            return self._timed(self.client, model, method, args, kwargs)
+
+        if method != "call_llm_with_json":
+            return self._hedged(model, method, args, kwargs)
+
+        try:
+            result, outcome = self._hedged(model, "call_llm_with_json_outcome", args, kwargs)
+        except ValueError:
+            self.client.record_json_outcome("failed")
+            raise
+        self.client.record_json_outcome(outcome)
+        return result
+
+    def _hedged(self, model: str, method: str, args, kwargs) -> Any:
+        """Run a primary call and, once it is slower than the hedge delay, a hedge."""
+        primary = self._start(self._timed, self.client, model, method, args, kwargs)
+        try:
+            return primary.result(timeout=self.hedge_delay(self._key(self.client, model)))
+        except FutureTimeoutError:
+            pass
+
+        hedge = self._hedge_pool.submit(self._timed, self.hedge_client, self.hedge_model, method, args, kwargs)
+        with self._stats_lock:
+            self.hedge_stats["hedged"] += 1
+
+        # Whichever finishes successfully first wins; the loser is discarded
+        pending = {primary, hedge}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    # A hedge still queued behind other hedges is not needed any more
+                    hedge.cancel()
+                    if future is hedge:
+                        with self._stats_lock:
+                            self.hedge_stats["hedge_wins"] += 1
+                    return future.result()
+                error = future.exception()
+
+        raise error
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get routing statistics.
+
+        Returns:
+            Dictionary with tier models, hedge counts and per-model latency
+        """
+        with self._stats_lock:
+            hedge_stats = dict(self.hedge_stats)
+
+        latency = {}
+        for key in self.latency.models():
+            latency[key] = {
+                "samples": self.latency.count(key),
+                "p50_s": self.latency.percentile(key, 50),
+                "p95_s": self.latency.percentile(key, 95)
+            }
+
+        return {
+            "tiers": dict(self.tiers),
+            "hedge_model": self.hedge_model,
+            **hedge_stats,
+            "latency": latency
+        }
+
+
+class RoutedLLMClient:
+    """LLM client bound to one router tier; drop-in for OpenRouterClient in agents."""
+
+    def __init__(self, router: ModelRouter, tier: str):
+        """
+        Initialize routed client.
+
+        Args:
+            router: Model router
+            tier: Tier name
+        """
+        self.router = router
+        self.tier = tier
+
+    @property
+    def model(self) -> str:
+        """Model used by this tier."""
+        return self.router.model_for(self.tier)
+
+    def call_llm(self, messages: List[Dict[str, str]], *args, **kwargs) -> str:
+        """Call the LLM on this tier's model (see OpenRouterClient.call_llm)."""
+        return self.router.call(self.tier, "call_llm", messages, *args, **kwargs)
+
+    def call_llm_with_json(self, messages: List[Dict[str, str]], *args, **kwargs) -> Dict[str, Any]:
+        """Call the LLM for JSON on this tier's model (see OpenRouterClient.call_llm_with_json)."""
+        return self.router.call(self.tier, "call_llm_with_json", messages, *args, **kwargs)
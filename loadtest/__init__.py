@@ -0,0 +1,4 @@
+"""Load testing module for AI Operations Assistant."""
+from .mock_upstream import LatencyModel, MockUpstream
+
+__all__ = ["LatencyModel", "MockUpstream"]
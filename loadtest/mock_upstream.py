@@ -0,0 +1,295 @@
+"""
+Local stand-in upstream servers for load testing.
+Serves NVIDIA chat completions (streaming and non-streaming), WeatherAPI,
+NewsAPI and GitHub search with injectable latency and error rates.
+"""
+
+import json
+import math
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+class LatencyModel:
+    """Random latency distribution for one upstream endpoint."""
+
+    def __init__(self, kind: str = "constant", mean: float = 0.0, spread: float = 0.0):
+        """
+        Initialize latency model.
+
+        Args:
+            kind: "constant", "exponential", "uniform" or "lognormal"
+            mean: Mean latency in seconds
+            spread: Half-width for uniform, sigma for lognormal (unused otherwise)
+        """
+        if kind not in ("constant", "exponential", "uniform", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {kind}")
+        self.kind = kind
+        self.mean = mean
+        self.spread = spread
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyModel":
+        """
+        Parse a "kind:mean[:spread]" spec, e.g. "lognormal:0.8:0.5".
+
+        Args:
+            spec: Latency spec string
+
+        Returns:
+            Latency model
+        """
+        parts = spec.split(":")
+        return cls(parts[0], *(float(p) for p in parts[1:]))
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency in seconds."""
+        if self.mean <= 0:
+            return 0.0
+        if self.kind == "exponential":
+            return rng.expovariate(1.0 / self.mean)
+        if self.kind == "uniform":
+            return max(0.0, rng.uniform(self.mean - self.spread, self.mean + self.spread))
+        if self.kind == "lognormal":
+            # mu chosen so the distribution's mean equals self.mean
+            mu = math.log(self.mean) - self.spread ** 2 / 2
+            return rng.lognormvariate(mu, self.spread)
+        return self.mean
+
+
+def _plan_for(task: str) -> Dict:
+    """Build a plausible plan for a task, as the planner LLM would."""
+    lowered = task.lower()
+    steps = []
+    if "github" in lowered or "repo" in lowered:
+        match = re.search(r"top (.+?) github", lowered)
+        steps.append({"tool": "github_search", "input": match.group(1) if match else "ai"})
+    if "weather" in lowered:
+        match = re.search(r"weather (?:in|for) ([a-z ]+?)(?:\?|$| and)", lowered)
+        steps.append({"tool": "weather_fetch", "input": match.group(1) if match else "London"})
+    if "news" in lowered:
+        match = re.search(r"news (?:about|on) ([a-z ]+?)(?:\?|$| and)", lowered)
+        steps.append({"tool": "news_fetch", "input": match.group(1) if match else "technology"})
+    return {"steps": steps or [{"tool": "news_fetch", "input": task}]}
+
+
+def _verification_for(prompt: str) -> Dict:
+    """Build per-step summaries for the formatted step results."""
+    steps = []
+    for number, tool, step_input in re.findall(r"Step (\d+):\n  Tool: (\S+)\n  Input: (.*)", prompt):
+        steps.append({
+            "step": int(number),
+            "summary": f"{tool} returned data for {step_input}.",
+            "findings": [f"{tool} result for {step_input} is complete"],
+            "data": {f"{tool}_{step_input}".replace(" ", "_").lower(): "ok"}
+        })
+    return {"steps": steps}
+
+
+class MockUpstream:
+    """Threaded local HTTP server impersonating every upstream API."""
+
+    def __init__(
+        self,
+        latencies: Optional[Dict[str, LatencyModel]] = None,
+        error_rates: Optional[Dict[str, float]] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int = 0
+    ):
+        """
+        Initialize mock upstream.
+
+        Args:
+            latencies: Latency model per endpoint ("llm", "weather", "news", "github")
+            error_rates: Probability of an HTTP 503 per endpoint
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+            seed: Random seed for latency and error sampling
+        """
+        self.latencies = latencies or {}
+        self.error_rates = error_rates or {}
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self.counts: Dict[str, int] = {}
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """Root URL of the server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def config_overrides(self) -> Dict[str, str]:
+        """Config attributes pointing every upstream at this server."""
+        return {
+            "NVIDIA_BASE_URL": f"{self.base_url}/v1",
+            "HEDGE_BASE_URL": f"{self.base_url}/v1",
+            "WEATHER_API_URL": f"{self.base_url}/v1/current.json",
+            "NEWS_API_URL": f"{self.base_url}/v2/everything",
+            "GITHUB_API_URL": f"{self.base_url}/search/repositories"
+        }
+
+    def start(self) -> "MockUpstream":
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-upstream", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _delay_and_fail(self, endpoint: str) -> bool:
+        """Sleep for the endpoint's latency; return True if this call should fail."""
+        with self._rng_lock:
+            self.counts[endpoint] = self.counts.get(endpoint, 0) + 1
+            model = self.latencies.get(endpoint)
+            delay = model.sample(self._rng) if model else 0.0
+            fail = self._rng.random() < self.error_rates.get(endpoint, 0.0)
+        if delay:
+            time.sleep(delay)
+        return fail
+
+    def _handler_class(self):
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send_json(self, status: int, body: Dict) -> None:
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+                if url.path.endswith("/current.json"):
+                    endpoint = "weather"
+                elif url.path.endswith("/everything"):
+                    endpoint = "news"
+                elif url.path.endswith("/search/repositories"):
+                    endpoint = "github"
+                else:
+                    self._send_json(404, {"message": "Not found"})
+                    return
+
+                if upstream._delay_and_fail(endpoint):
+                    self._send_json(503, {"message": "Injected failure"})
+                    return
+
+                q = query.get("q", "")
+                if endpoint == "weather":
+                    self._send_json(200, {
+                        "location": {"name": q.title()},
+                        "current": {"temp_c": 20.0 + len(q) % 15, "condition": {"text": "Sunny"}}
+                    })
+                elif endpoint == "news":
+                    size = int(query.get("pageSize", 5))
+                    self._send_json(200, {"status": "ok", "articles": [
+                        {
+                            "title": f"{q} story {i % max(1, size // 2)}",
+                            "description": f"Coverage of {q}.",
+                            "url": f"https://news.example/{i}",
+                            "source": {"name": f"Source {i % 7}"},
+                            "publishedAt": f"2024-01-{1 + i % 28:02d}T12:00:00Z"
+                        }
+                        for i in range(size)
+                    ]})
+                else:
+                    self._send_json(200, {"items": [{
+                        "name": f"{q.replace(' ', '-')}-project",
+                        "stargazers_count": 1000 + len(q),
+                        "html_url": f"https://github.example/{q.replace(' ', '-')}",
+                        "description": f"Top repository for {q}"
+                    }]})
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+
+                if not self.path.endswith("/chat/completions"):
+                    self._send_json(404, {"message": "Not found"})
+                    return
+
+                if upstream._delay_and_fail("llm"):
+                    self._send_json(503, {"error": {"message": "Injected failure"}})
+                    return
+
+                messages = body.get("messages", [])
+                system = messages[0]["content"] if messages else ""
+                user = messages[-1]["content"] if messages else ""
+                if "planning agent" in system:
+                    content = json.dumps(_plan_for(user.split(":", 1)[-1].strip()))
+                else:
+                    content = json.dumps(_verification_for(user))
+
+                usage = {
+                    "prompt_tokens": sum(len(m.get("content", "")) for m in messages) // 4,
+                    "completion_tokens": len(content) // 4
+                }
+                usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+                base = {"id": "mock", "created": int(time.time()), "model": body.get("model", "mock")}
+
+                if not body.get("stream"):
+                    self._send_json(200, {
+                        **base,
+                        "object": "chat.completion",
+                        "choices": [{
+                            "index": 0,
+                            "message": {"role": "assistant", "content": content},
+                            "finish_reason": "stop"
+                        }],
+                        "usage": usage
+                    })
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.close_connection = True
+
+                pieces = [content[i:i + 16] for i in range(0, len(content), 16)]
+                for i, piece in enumerate(pieces):
+                    chunk = {
+                        **base,
+                        "object": "chat.completion.chunk",
+                        "choices": [{
+                            "index": 0,
+                            "delta": {"content": piece},
+                            "finish_reason": "stop" if i == len(pieces) - 1 else None
+                        }]
+                    }
+                    try:
+                        self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+                    except (BrokenPipeError, ConnectionResetError):
+                        return
+                if (body.get("stream_options") or {}).get("include_usage"):
+                    chunk = {**base, "object": "chat.completion.chunk", "choices": [], "usage": usage}
+                    try:
+                        self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+                    except (BrokenPipeError, ConnectionResetError):
+                        return
+                try:
+                    self.wfile.write(b"data: [DONE]\n\n")
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+        return Handler
@@ -0,0 +1,250 @@
+"""
+Open-loop load generator for AI Operations Assistant.
+Drives the full pipeline against local mock upstreams at increasing arrival
+rates and reports latency-vs-throughput curves and the saturation point.
+
+Usage:
+    python -m loadtest.run --rates 1,2,5,10,20 --duration 30
+    python -m loadtest.run --llm-latency lognormal:0.8:0.5 --error-rate 0.02 --no-result-cache
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from loadtest.mock_upstream import LatencyModel, MockUpstream
+
+
+CITIES = ["Mumbai", "London", "New York", "Tokyo", "Paris", "Berlin", "Sydney", "Delhi"]
+TOPICS = ["ai", "machine learning", "python", "robotics", "climate", "security"]
+TEMPLATES = [
+    "What's the weather in {city}?",
+    "Get latest news about {topic}",
+    "Find top {topic} github repo",
+    "Find top {topic} github repo and current weather in {city}",
+    "Find top {topic} github repo, weather in {city}, and latest news about {topic}",
+]
+
+
+def build_tasks(count: int, rng: random.Random) -> List[str]:
+    """Build a mix of single- and multi-tool tasks with repeats, like real traffic."""
+    return [
+        rng.choice(TEMPLATES).format(city=rng.choice(CITIES), topic=rng.choice(TOPICS))
+        for _ in range(count)
+    ]
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+
+def _run_one(assistant: Any, task: str, scheduled: float) -> Dict[str, Any]:
+    """Run one task; latency is measured from its scheduled arrival."""
+    try:
+        result = assistant.process_task(task)
+        ok = result.get("status") in ("success", "partial")
+    except Exception:
+        ok = False
+    return {"latency": time.perf_counter() - scheduled, "ok": ok, "finished": time.perf_counter()}
+
+
+def run_rate(
+    factory: Callable[[], Any],
+    rate: float,
+    duration: float,
+    tasks: List[str],
+    rng: random.Random,
+    max_concurrency: int,
+    drain_timeout: float
+) -> Dict[str, Any]:
+    """
+    Offer Poisson arrivals at a fixed rate, independent of completions.
+
+    Args:
+        factory: Builds a fresh assistant for this rate
+        rate: Arrivals per second
+        duration: Seconds of arrivals
+        tasks: Task pool to draw from
+        rng: Random source
+        max_concurrency: Threads available to in-flight tasks
+        drain_timeout: Seconds to wait for outstanding tasks after arrivals stop;
+            later tasks count as timed out (running ones are still awaited)
+
+    Returns:
+        Report for this rate
+    """
+    assistant = factory()
+    pool = ThreadPoolExecutor(max_workers=max_concurrency)
+    futures = []
+
+    start = time.perf_counter()
+    offset = 0.0
+    while True:
+        offset += rng.expovariate(rate)
+        if offset > duration:
+            break
+        delay = start + offset - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        futures.append(pool.submit(_run_one, assistant, rng.choice(tasks), start + offset))
+
+    deadline = time.perf_counter() + drain_timeout
+    outcomes = []
+    for future in futures:
+        try:
+            outcomes.append(future.result(timeout=max(0.0, deadline - time.perf_counter())))
+        except Exception:
+            outcomes.append(None)
+
+    # Tasks past the deadline count as timed out, but must not run into the
+    # next rate: drop the ones not started and wait for the rest to finish
+    for future in futures:
+        future.cancel()
+    pool.shutdown(wait=True)
+
+    completed = [o for o in outcomes if o is not None]
+    succeeded = [o for o in completed if o["ok"]]
+    latencies = [o["latency"] for o in succeeded]
+    elapsed = (max(o["finished"] for o in completed) - start) if completed else duration
+
+    return {
+        "offered_rps": rate,
+        "arrivals": len(futures),
+        "arrival_rps": len(futures) / duration,
+        "completed": len(completed),
+        "timed_out": len(outcomes) - len(completed),
+        "throughput_rps": len(succeeded) / elapsed if elapsed > 0 else 0.0,
+        "error_rate": 1 - len(succeeded) / len(futures) if futures else 0.0,
+        "p50_s": _percentile(latencies, 50),
+        "p95_s": _percentile(latencies, 95),
+        "p99_s": _percentile(latencies, 99)
+    }
+
+
+def find_saturation(curve: List[Dict[str, Any]], slo_p95: float, max_error_rate: float) -> Dict[str, Any]:
+    """
+    Find the first rate at which the pipeline stops keeping up.
+
+    A rate is saturated when goodput falls below 90% of the realized
+    arrival rate (Poisson arrivals vary around the offered rate),
+    p95 latency exceeds the SLO, or the error rate exceeds its limit.
+
+    Args:
+        curve: Reports per rate, in increasing rate order
+        slo_p95: p95 latency objective in seconds
+        max_error_rate: Highest acceptable error rate
+
+    Returns:
+        Saturation report (sustainable and saturating rates, with reasons)
+    """
+    sustainable = None
+    for point in curve:
+        reasons = []
+        if point["throughput_rps"] < 0.9 * point["arrival_rps"]:
+            reasons.append("throughput below 90% of arrival rate")
+        if point["p95_s"] > slo_p95:
+            reasons.append(f"p95 above {slo_p95}s SLO")
+        if point["error_rate"] > max_error_rate:
+            reasons.append(f"error rate above {max_error_rate:.0%}")
+        if reasons:
+            return {
+                "max_sustainable_rps": sustainable,
+                "saturated_at_rps": point["offered_rps"],
+                "reasons": reasons
+            }
+        sustainable = point["offered_rps"]
+    return {"max_sustainable_rps": sustainable, "saturated_at_rps": None, "reasons": []}
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Open-loop load test against mock upstreams")
+    parser.add_argument("--rates", default="1,2,5,10,20", help="comma-separated arrival rates (tasks/s)")
+    parser.add_argument("--duration", type=float, default=30, help="seconds of arrivals per rate")
+    parser.add_argument("--llm-latency", default="lognormal:0.8:0.5", help="kind:mean[:spread] seconds")
+    parser.add_argument("--tool-latency", default="lognormal:0.2:0.4", help="kind:mean[:spread] seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="injected failure rate per upstream call")
+    parser.add_argument("--slo-p95", type=float, default=10.0, help="p95 latency objective in seconds")
+    parser.add_argument("--max-error-rate", type=float, default=0.05)
+    parser.add_argument("--max-concurrency", type=int, default=256)
+    parser.add_argument("--no-result-cache", action="store_true")
+    parser.add_argument("--no-semantic-cache", action="store_true")
+    parser.add_argument("--merge-plans", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="loadtest_results.json", help="JSON report path")
+    args = parser.parse_args()
+
+    tool_latency = LatencyModel.parse(args.tool_latency)
+    upstream = MockUpstream(
+        latencies={
+            "llm": LatencyModel.parse(args.llm_latency),
+            "weather": tool_latency,
+            "news": tool_latency,
+            "github": tool_latency
+        },
+        error_rates={name: args.error_rate for name in ("llm", "weather", "news", "github")},
+        seed=args.seed
+    ).start()
+
+    for name, value in upstream.config_overrides().items():
+        setattr(Config, name, value)
+    for name in ("NVIDIA_API_KEY", "WEATHER_API_KEY", "NEWS_API_KEY"):
+        setattr(Config, name, getattr(Config, name) or "loadtest")
+    Config.RESULT_CACHE_ENABLED = not args.no_result_cache
+    Config.SEMANTIC_CACHE_ENABLED = not args.no_semantic_cache
+    Config.PLAN_MERGE_ENABLED = args.merge_plans
+
+    from main import AIOpsAssistant
+
+    rng = random.Random(args.seed)
+    tasks = build_tasks(200, rng)
+    mode = {
+        "result_cache": Config.RESULT_CACHE_ENABLED,
+        "semantic_cache": Config.SEMANTIC_CACHE_ENABLED,
+        "plan_merge": Config.PLAN_MERGE_ENABLED,
+        "llm_latency": args.llm_latency,
+        "tool_latency": args.tool_latency,
+        "error_rate": args.error_rate
+    }
+    print(f"Mode: {mode}")
+    print(f"{'offered':>8} {'goodput':>8} {'p50_s':>7} {'p95_s':>7} {'p99_s':>7} {'errors':>7}")
+
+    curve = []
+    out = sys.stdout
+    for rate in (float(r) for r in args.rates.split(",")):
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            point = run_rate(
+                AIOpsAssistant, rate, args.duration, tasks, rng,
+                args.max_concurrency, drain_timeout=max(30.0, args.slo_p95 * 3)
+            )
+        curve.append(point)
+        print(
+            f"{point['offered_rps']:>8.1f} {point['throughput_rps']:>8.2f} {point['p50_s']:>7.2f} "
+            f"{point['p95_s']:>7.2f} {point['p99_s']:>7.2f} {point['error_rate']:>7.1%}",
+            file=out
+        )
+
+    upstream.stop()
+    saturation = find_saturation(curve, args.slo_p95, args.max_error_rate)
+    print(f"\nSaturation: {saturation}")
+    print(f"Upstream calls: {upstream.counts}")
+
+    with open(args.output, "w") as f:
+        json.dump({"mode": mode, "curve": curve, "saturation": saturation, "upstream_calls": upstream.counts}, f, indent=2)
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,23 @@ Main orchestrator for AI Operations Assistant.
 Coordinates planner, executor, and verifier agents to complete tasks.
 """
 
+import argparse
+import contextlib
 import json
+import os
 import sys
+import threading
 from config import Config
 from llm.openrouter_client import OpenRouterClient
+from llm.router import ModelRouter
 from agents.planner import PlannerAgent
 from agents.executor import ExecutorAgent
 from agents.verifier import VerifierAgent
+from agents.plan_merger import PlanMerger
+from cache.result_cache import RefreshingCache
+from records import to_plain
+from profiler import PipelineProfiler
+from metrics import REGISTRY, STAGE_SECONDS, TASKS, session_pool_stats, start_metrics_server
 
 
 class AIOpsAssistant:
@@ -24,10 +34,97 @@ class AIOpsAssistant:
             print("Please ensure .env file is set up correctly.")
             sys.exit(1)
         
+        # Cheap to build: the OpenAI SDK and HTTP sessions load on first use
         self.llm = OpenRouterClient()
-        self.planner = PlannerAgent(self.llm)
-        self.executor = ExecutorAgent()
-        self.verifier = VerifierAgent(self.llm)
+        self.router = ModelRouter(self.llm)
+        self.plan_cache = None
+        if Config.SEMANTIC_CACHE_ENABLED:
+            from cache.semantic_cache import SemanticCache
+            self.plan_cache = SemanticCache()
+        self.result_cache = RefreshingCache() if Config.RESULT_CACHE_ENABLED else None
+        self.planner = PlannerAgent(self.router.for_tier("planner"), self.plan_cache, self.result_cache)
+        self.executor = ExecutorAgent(self.result_cache)
+        self.merger = PlanMerger(self.executor) if Config.PLAN_MERGE_ENABLED else None
+        self.profiler = PipelineProfiler()
+        self.verifier = VerifierAgent(self.router.for_tier("verifier"))
+        
+        REGISTRY.register_collector("assistant", self.collect_metrics)
+        if Config.METRICS_ENABLED:
+            start_metrics_server()
+    
+    def collect_metrics(self):
+        """
+        Yield gauge samples from component statistics, read at scrape time.
+        
+        Yields:
+            (metric name, help text, labels, value) tuples
+        """
+        for tool_name, tool in list(self.executor.tools.items()):
+            connections, requests_sent = session_pool_stats(getattr(tool, "_session", None))
+            labels = {"tool": tool_name}
+            yield "aiops_http_pool_connections", "HTTP connections opened per tool session", labels, connections
+            yield "aiops_http_pool_requests", "HTTP requests sent per tool session", labels, requests_sent
+            reuse = 1 - connections / requests_sent if requests_sent else 0.0
+            yield "aiops_http_pool_reuse_ratio", "Share of requests sent on a reused connection", labels, reuse
+        
+        caches = [("verifier_step", self.verifier.stats())]
+        if self.plan_cache is not None:
+            caches.append(("semantic_plan", self.plan_cache.stats()))
+        if self.result_cache is not None:
+            result_stats = self.result_cache.stats()
+            caches.append(("result", result_stats))
+            yield "aiops_result_cache_refresh_queue", "Entries waiting for a background refresh", {}, result_stats["refresh_queue"]
+        for name, stats in caches:
+            ratio = stats.get("hit_ratio", stats.get("hit_rate", 0.0))
+            yield "aiops_cache_hit_ratio", "Cache hit ratio since start", {"cache": name}, ratio
+            yield "aiops_cache_entries", "Entries held per cache", {"cache": name}, stats["size"]
+        
+        json_stats = self.llm.json_parse_stats()
+        for outcome in ("direct", "extracted", "repaired", "reasked", "failed"):
+            yield "aiops_llm_json_outcomes", "JSON responses by parse outcome", {"outcome": outcome}, json_stats[outcome]
+        
+        router_stats = self.router.stats()
+        for kind in ("calls", "hedged", "hedge_wins"):
+            yield "aiops_llm_hedge_requests", "Routed LLM calls, hedges sent and hedges won", {"kind": kind}, router_stats[kind]
+        
+        if self.merger is not None:
+            merge_stats = self.merger.stats()
+            yield "aiops_plan_merge_fan_in_ratio", "Tool steps requested per call executed", {}, merge_stats["fan_in_ratio"]
+            yield "aiops_plan_merge_added_latency_p95_ms", "p95 end-to-end latency added per merged task", {}, merge_stats["added_latency_p95_ms"]
+    
+    def warm_up(self) -> threading.Thread:
+        """
+        Create the LLM clients, tools and HTTP sessions in a background thread.
+        
+        Lets interactive front ends hide import cost while the user types;
+        join the returned thread to warm up synchronously (batch workers).
+        
+        Returns:
+            The started daemon thread
+        """
+        def _load():
+            self.llm.client
+            if self.router.hedge_client is not None:
+                self.router.hedge_client.client
+            self.executor.warm_up()
+        
+        thread = threading.Thread(target=_load, name="assistant-warm-up", daemon=True)
+        thread.start()
+        return thread
+    
+    def execute_plan(self, plan) -> list:
+        """
+        Execute a plan, merging tool calls with concurrent tasks when enabled.
+        
+        Args:
+            plan: Execution plan from the planner
+            
+        Returns:
+            List of step results
+        """
+        if self.merger is not None:
+            return self.merger.execute(plan)
+        return self.executor.execute_plan(plan)
     
     def process_task(self, task: str) -> dict:
         """
@@ -39,6 +136,13 @@ class AIOpsAssistant:
         Returns:
             Dictionary containing final results
         """
+        with self.profiler.task(task), STAGE_SECONDS.time(stage="total"):
+            result = self._process_task(task)
+        TASKS.inc(status=result.get("status", "unknown"))
+        return result
+    
+    def _process_task(self, task: str) -> dict:
+        """Run the pipeline stages for a task (see process_task)."""
         print("=" * 60)
         print("AI Operations Assistant")
         print("=" * 60)
@@ -47,20 +151,23 @@ class AIOpsAssistant:
         # Step 1: Planning
         print("[Planner] Creating execution plan...")
         try:
-            plan = self.planner.create_plan(task)
+            with self.profiler.stage("planning"), STAGE_SECONDS.time(stage="planning"):
+                plan = self.planner.create_plan(task)
             print(f"[Planner] Plan created with {len(plan['steps'])} step(s)")
-            print(json.dumps(plan, indent=2))
+            print(json.dumps(plan, indent=2, default=to_plain))
         except Exception as e:
             print(f"[Planner] Error: {e}")
             return {"status": "failed", "error": str(e), "stage": "planning"}
         
         # Step 2: Execution
         print("\n[Executor] Executing plan...")
-        results = self.executor.execute_plan(plan)
+        with self.profiler.stage("execution"), STAGE_SECONDS.time(stage="execution"):
+            results = self.execute_plan(plan)
         
         # Step 3: Verification
         print("\n[Verifier] Verifying results and creating summary...")
-        verification = self.verifier.verify_results(results)
+        with self.profiler.stage("verification"), STAGE_SECONDS.time(stage="verification"):
+            verification = self.verifier.verify_results(results)
         
         # Step 4: Final Output
         print("\n" + "=" * 60)
@@ -81,17 +188,82 @@ class AIOpsAssistant:
         
         if verification.get('final_answer'):
             print("\nFinal Answer:")
-            print(json.dumps(verification['final_answer'], indent=2))
+            print(json.dumps(verification['final_answer'], indent=2, default=to_plain))
         
         return verification
 
 
+_shared_assistant = None
+_shared_lock = threading.Lock()
+
+
+def get_assistant() -> AIOpsAssistant:
+    """
+    Get the process-wide shared assistant, creating it on first call.
+    
+    Returns:
+        Shared AIOpsAssistant instance
+    """
+    global _shared_assistant
+    if _shared_assistant is None:
+        with _shared_lock:
+            if _shared_assistant is None:
+                _shared_assistant = AIOpsAssistant()
+    return _shared_assistant
+
+
+def run_batch(path: str, workers: int) -> None:
+    """
+    Process tasks from a file (one per line) and print one JSON result per line.
+    
+    Args:
+        path: File containing tasks
+        workers: Number of worker processes (1 runs in this process)
+    """
+    with open(path) as f:
+        tasks = [line.strip() for line in f if line.strip()]
+    
+    if workers == 1:
+        assistant = get_assistant()
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            results = [assistant.process_task(task) for task in tasks]
+    else:
+        from workers.process_pool import TaskWorkerPool
+        with TaskWorkerPool(workers or None) as pool:
+            results = pool.map(tasks)
+    
+    for task, result in zip(tasks, results):
+        print(json.dumps({"task": task, **result}, default=to_plain))
+
+
 def main():
     """Main entry point for CLI usage."""
+    parser = argparse.ArgumentParser(description="AI Operations Assistant")
+    parser.add_argument("--batch", metavar="FILE", help="process tasks from FILE, one per line")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="worker processes for --batch (0 = one per CPU core)"
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help=f"write per-task profiles and collapsed stacks to {Config.PROFILE_DIR}/"
+    )
+    args = parser.parse_args()
+    
+    if args.profile:
+        # Environment too, so spawned batch workers profile as well
+        os.environ["PROFILE_ENABLED"] = "true"
+        Config.PROFILE_ENABLED = True
+    
+    if args.batch:
+        run_batch(args.batch, args.workers)
+        return
+    
     print("\nAI Operations Assistant - Multi-Agent System")
     print("Enter a task or 'quit' to exit\n")
     
-    assistant = AIOpsAssistant()
+    assistant = get_assistant()
+    assistant.warm_up()
     
     while True:
         try:
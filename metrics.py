@@ -0,0 +1,340 @@
+"""
+Runtime metrics for AI Operations Assistant.
+In-process counters, gauges and histograms with labels, plus collectors that
+read component statistics on demand, rendered in Prometheus text format and
+served from a local /metrics endpoint.
+"""
+
+import bisect
+import contextlib
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from config import Config
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# A collector yields (metric name, help text, labels, value) gauge samples
+Sample = Tuple[str, str, Dict[str, str], float]
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+class _Metric:
+    """Labelled metric family."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def values(self) -> Dict[Tuple[str, ...], Any]:
+        """Copy of the current value per label set."""
+        with self._lock:
+            return dict(self._values)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for key, value in sorted(self.values().items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {value}")
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        """Add to the count for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the value for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """Distribution of observations in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record one observation for a label set."""
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # Per-bucket (non-cumulative) counts, then +Inf, then sum
+                state = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            state[index] += 1
+            state[-1] += value
+
+    @contextlib.contextmanager
+    def time(self, **labels: Any):
+        """Observe the duration of a block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def values(self) -> Dict[Tuple[str, ...], Any]:
+        with self._lock:
+            return {key: list(state) for key, state in self._values.items()}
+
+    def summary(self, **labels: Any) -> Dict[str, float]:
+        """
+        Count, sum and bucket-estimated p50/p95 for one label set.
+
+        Returns:
+            Dictionary with count, sum, avg, p50 and p95 (upper bucket bounds)
+        """
+        state = self.values().get(self._key(labels))
+        if state is None:
+            return {"count": 0, "sum": 0.0, "avg": 0.0, "p50": 0.0, "p95": 0.0}
+        counts = state[:-1]
+        total = sum(counts)
+        bounds = self.buckets + (float("inf"),)
+
+        def quantile(q: float) -> float:
+            running = 0
+            for bound, count in zip(bounds, counts):
+                running += count
+                if running >= q * total:
+                    return bound
+            return bounds[-1]
+
+        return {
+            "count": total,
+            "sum": state[-1],
+            "avg": state[-1] / total if total else 0.0,
+            "p50": quantile(0.5),
+            "p95": quantile(0.95)
+        }
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        bucket_names = self.labelnames + ("le",)
+        for key, state in sorted(self.values().items()):
+            running = 0
+            for bound, count in zip(self.buckets + (float("inf"),), state[:-1]):
+                running += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_names, key + (le,))} {running}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {state[-1]}")
+            lines.append(f"{self.name}_count{labels} {running}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metrics plus on-demand collectors, rendered together."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: Dict[str, Callable[[], Iterable[Sample]]] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._register(Counter(name, help_text, labelnames))
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._register(Gauge(name, help_text, labelnames))
+
+    def histogram(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Get or create a histogram."""
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+
+    def register_collector(self, name: str, collector: Callable[[], Iterable[Sample]]) -> None:
+        """
+        Register a callable producing gauge samples at scrape time.
+
+        Args:
+            name: Collector name; registering the same name again replaces it
+            collector: Callable yielding (metric name, help, labels, value)
+        """
+        with self._lock:
+            self._collectors[name] = collector
+
+    def collect(self) -> List[Sample]:
+        """Run all collectors; a failing collector is skipped."""
+        with self._lock:
+            collectors = list(self._collectors.values())
+
+        samples: List[Sample] = []
+        for collector in collectors:
+            try:
+                samples.extend(collector())
+            except Exception as e:
+                print(f"[Metrics] Collector failed: {e}")
+        return samples
+
+    def render(self) -> str:
+        """
+        Render all metrics in Prometheus text exposition format.
+
+        Returns:
+            Exposition text
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+
+        families: Dict[str, List[Sample]] = {}
+        for sample in self.collect():
+            families.setdefault(sample[0], []).append(sample)
+        for name, family in families.items():
+            lines.append(f"# HELP {name} {family[0][1]}")
+            lines.append(f"# TYPE {name} gauge")
+            for _, _, labels, value in family:
+                lines.append(f"{name}{_format_labels(tuple(labels), tuple(labels.values()))} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+TASKS = REGISTRY.counter("aiops_tasks_total", "Tasks processed, by final status", ("status",))
+STAGE_SECONDS = REGISTRY.histogram("aiops_stage_duration_seconds", "Pipeline stage latency", ("stage",))
+LLM_REQUESTS = REGISTRY.counter("aiops_llm_requests_total", "LLM requests, by model and mode", ("model", "mode"))
+LLM_SECONDS = REGISTRY.histogram("aiops_llm_request_duration_seconds", "LLM request latency", ("model",))
+LLM_TOKENS = REGISTRY.counter(
+    "aiops_llm_tokens_total",
+    "LLM tokens, by model and kind (prompt, completion; completion_chunks counts "
+    "stream chunks when an endpoint reports no usage)",
+    ("model", "kind")
+)
+LLM_RETRIES = REGISTRY.counter("aiops_llm_retries_total", "LLM request retries", ("model",))
+TOOL_CALLS = REGISTRY.counter("aiops_tool_calls_total", "Tool calls, by tool and status", ("tool", "status"))
+TOOL_SECONDS = REGISTRY.histogram("aiops_tool_duration_seconds", "Tool call latency, cache hits included", ("tool",))
+
+
+def session_pool_stats(session: Any) -> Tuple[int, int]:
+    """
+    Count connections opened and requests sent through a requests.Session.
+
+    Args:
+        session: requests.Session (or None if not created yet)
+
+    Returns:
+        (connections opened, requests sent) across the session's urllib3 pools
+    """
+    connections = requests_sent = 0
+    if session is None:
+        return connections, requests_sent
+    for adapter in session.adapters.values():
+        manager = getattr(adapter, "poolmanager", None)
+        if manager is None:
+            continue
+        pools = manager.pools
+        with pools.lock:
+            pool_list = [pools[key] for key in pools.keys()]
+        for pool in pool_list:
+            connections += pool.num_connections
+            requests_sent += pool.num_requests
+    return connections, requests_sent
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(
+    registry: MetricsRegistry = REGISTRY,
+    port: Optional[int] = None,
+    host: Optional[str] = None
+) -> Optional[Any]:
+    """
+    Serve /metrics from a background thread (once per process).
+
+    Args:
+        registry: Registry to expose
+        port: Port to bind (defaults to config)
+        host: Interface to bind (defaults to config)
+
+    Returns:
+        The running server, or None if the port could not be bound
+    """
+    global _server
+    with _server_lock:
+        if _server is not None:
+            return _server
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        address = (host or Config.METRICS_HOST, Config.METRICS_PORT if port is None else port)
+        try:
+            server = ThreadingHTTPServer(address, Handler)
+        except OSError as e:
+            print(f"[Metrics] Could not serve metrics on {address[0]}:{address[1]}: {e}")
+            return None
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+        _server = server
+        print(f"[Metrics] Serving http://{address[0]}:{server.server_address[1]}/metrics")
+        return _server
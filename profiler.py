@@ -0,0 +1,219 @@
+"""
+Pipeline profiler for AI Operations Assistant.
+Opt-in per-task profiling: cProfile stats, sampled call stacks aggregated
+into a collapsed-stack file for flame graphs, and tracemalloc deltas per stage.
+"""
+
+import contextlib
+import cProfile
+import json
+import os
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from config import Config
+
+
+_NULL_CONTEXT = contextlib.nullcontext()
+
+
+class _TaskProfile:
+    """Profiling state for one task running on one thread."""
+
+    def __init__(self, profiler: "PipelineProfiler", label: str):
+        self.profiler = profiler
+        self.label = label
+        self.thread_id = threading.get_ident()
+        self.stages: List[str] = []
+        self.stage_reports: List[Dict[str, Any]] = []
+        self.samples: Counter = Counter()
+        self._cprofile = cProfile.Profile()
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._sample, name="profile-sampler", daemon=True)
+
+    def _sample(self) -> None:
+        """Record the task thread's call stack every sample interval."""
+        own_file = os.path.abspath(__file__)
+        while not self._stop.wait(self.profiler.sample_interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                if os.path.abspath(code.co_filename) != own_file:
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                prefix = [f"stage:{s}" for s in self.stages] or ["stage:other"]
+                self.samples[";".join(prefix + stack[::-1])] += 1
+
+    def __enter__(self) -> "_TaskProfile":
+        self.started = time.perf_counter()
+        self._mem_start = tracemalloc.take_snapshot()
+        try:
+            self._cprofile.enable()
+        except Exception as e:
+            # Python 3.12+ allows one cProfile per process; profiling must not
+            # fail the task, so keep only stack samples and tracemalloc
+            print(f"[Profiler] cProfile unavailable for this task: {e}")
+            self._cprofile = None
+        self._sampler.start()
+        self.profiler._task_started()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        self._stop.set()
+        self._sampler.join()
+        self.profiler._task_ended()
+        seconds = time.perf_counter() - self.started
+        top_allocations = [
+            str(stat) for stat in
+            tracemalloc.take_snapshot().compare_to(self._mem_start, "lineno")[:10]
+        ]
+        self.profiler._finish(self, seconds, top_allocations)
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """
+        Time a stage and record its tracemalloc memory delta.
+
+        tracemalloc is process-wide, so the memory numbers include other
+        threads' allocations. The peak is reported only when no other
+        profiled task overlapped the stage and tracemalloc.reset_peak()
+        exists (Python 3.9+); otherwise it is None.
+        """
+        marker = self.profiler._exclusive_marker()
+        track_peak = marker is not None and hasattr(tracemalloc, "reset_peak")
+        if track_peak:
+            tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        self.stages.append(name)
+        try:
+            yield
+        finally:
+            self.stages.pop()
+            after, peak = tracemalloc.get_traced_memory()
+            overlapped = marker is None or self.profiler._exclusive_marker() != marker
+            self.stage_reports.append({
+                "stage": name,
+                "seconds": time.perf_counter() - start,
+                "memory_delta_bytes": after - before,
+                "memory_peak_bytes": peak - before if track_peak and not overlapped else None,
+                "overlapping_tasks": overlapped
+            })
+
+
+class PipelineProfiler:
+    """Opt-in profiler for pipeline tasks and stages; a no-op when disabled."""
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        output_dir: Optional[str] = None,
+        sample_interval: float = Config.PROFILE_SAMPLE_INTERVAL
+    ):
+        """
+        Initialize profiler.
+
+        Args:
+            enabled: Whether profiling is active (defaults to config at call time)
+            output_dir: Directory for per-task profiles and collapsed stacks
+            sample_interval: Seconds between stack samples
+        """
+        self.enabled = Config.PROFILE_ENABLED if enabled is None else enabled
+        self.output_dir = output_dir or Config.PROFILE_DIR
+        self.sample_interval = sample_interval
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._collapsed: Counter = Counter()
+        self._task_count = 0
+        self._active = 0
+        self._generation = 0
+
+    def task(self, label: str):
+        """
+        Profile one task on the current thread.
+
+        Args:
+            label: Task description used in output file names
+
+        Returns:
+            Context manager (a shared no-op when disabled)
+        """
+        if not self.enabled or getattr(self._local, "current", None) is not None:
+            return _NULL_CONTEXT
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        profile = _TaskProfile(self, label)
+        self._local.current = profile
+        return profile
+
+    def stage(self, name: str):
+        """
+        Profile a stage of the current task.
+
+        Args:
+            name: Stage name (e.g. "planning")
+
+        Returns:
+            Context manager (a shared no-op when disabled or outside a task)
+        """
+        if not self.enabled:
+            return _NULL_CONTEXT
+        profile = getattr(self._local, "current", None)
+        if profile is None:
+            return _NULL_CONTEXT
+        return profile.stage(name)
+
+    def _task_started(self) -> None:
+        with self._lock:
+            self._active += 1
+            self._generation += 1
+
+    def _task_ended(self) -> None:
+        with self._lock:
+            self._active -= 1
+
+    def _exclusive_marker(self) -> Optional[int]:
+        """Task generation if exactly one profiled task is running, else None."""
+        with self._lock:
+            return self._generation if self._active == 1 else None
+
+    def _finish(self, profile: _TaskProfile, seconds: float, top_allocations: List[str]) -> None:
+        """Write a finished task's profile and update the aggregated stacks."""
+        self._local.current = None
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        with self._lock:
+            self._task_count += 1
+            slug = re.sub(r"[^a-z0-9]+", "-", profile.label.lower()).strip("-")[:40] or "task"
+            base = os.path.join(self.output_dir, f"{time.strftime('%Y%m%d-%H%M%S')}-{self._task_count:04d}-{slug}")
+
+            self._collapsed.update(profile.samples)
+            with open(os.path.join(self.output_dir, "collapsed.txt"), "w") as f:
+                for stack, count in self._collapsed.most_common():
+                    f.write(f"{stack} {count}\n")
+
+        written = [f"{base}.json"]
+        if profile._cprofile is not None:
+            profile._cprofile.dump_stats(f"{base}.prof")
+            written.insert(0, f"{base}.prof")
+        with open(f"{base}.json", "w") as f:
+            json.dump({
+                "task": profile.label,
+                "seconds": seconds,
+                "cprofile": profile._cprofile is not None,
+                "samples": sum(profile.samples.values()),
+                "stages": profile.stage_reports,
+                "top_allocations": top_allocations
+            }, f, indent=2)
+
+        print(f"[Profiler] Wrote {' and '.join(written)}")
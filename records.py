@@ -0,0 +1,222 @@
+"""
+Record types for AI Operations Assistant.
+Compact __slots__ records for plans, step results, tool results and
+verifications. Records are Mappings over their fields, so existing
+dict-style access (record["key"], record.get("key"), **record) keeps working.
+"""
+
+import json
+from collections.abc import Mapping
+from json.encoder import encode_basestring_ascii
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class Record(Mapping):
+    """Base class for slotted records with a dict-compatible view."""
+
+    __slots__ = ()
+
+    # Fields left out of the mapping view while they are None
+    _optional = frozenset()
+
+    def __init__(self, *args, **kwargs):
+        """Set fields positionally or by keyword; missing fields default to None."""
+        values = dict(zip(self.__slots__, args))
+        values.update(kwargs)
+        for field in self.__slots__:
+            setattr(self, field, values.get(field))
+
+    def _present(self, field: str) -> bool:
+        """Whether a field is part of the mapping view."""
+        return field not in self._optional or getattr(self, field) is not None
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__slots__ and self._present(key):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __iter__(self) -> Iterator[str]:
+        return (field for field in self.__slots__ if self._present(field))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to plain (JSON-ready) dicts and lists."""
+        return to_plain(self)
+
+    def to_json(self) -> str:
+        """Encode as compact JSON without building intermediate dicts."""
+        return dumps(self)
+
+
+class PlanStep(Record):
+    """One step of an execution plan."""
+
+    __slots__ = ("tool", "input")
+
+
+class Plan(Record):
+    """Execution plan produced by the planner."""
+
+    __slots__ = ("steps", "degraded")
+    _optional = frozenset({"degraded"})
+
+    @classmethod
+    def from_dict(cls, data: Mapping, degraded: bool = False) -> "Plan":
+        """
+        Build a plan from validated planner JSON.
+
+        Args:
+            data: Planner JSON with a "steps" list
+            degraded: Whether the JSON was repaired from truncated output
+                (such plans may be missing steps and are never cached)
+        """
+        steps = [PlanStep(step["tool"], step["input"]) for step in data["steps"]]
+        return cls(steps, degraded=True if degraded else None)
+
+
+class StepResult(Record):
+    """Outcome of executing one plan step."""
+
+    __slots__ = ("step", "tool", "input", "status", "result", "error")
+    _optional = frozenset({"result", "error"})
+
+
+class GitHubRepo(Record):
+    """Top repository returned by the GitHub tool."""
+
+    __slots__ = ("name", "stars", "url", "description")
+
+
+class WeatherReport(Record):
+    """Current weather returned by the weather tool."""
+
+    __slots__ = ("city", "temperature_c", "condition")
+
+
+class NewsArticle(Record):
+    """One article returned by the news tool."""
+
+    __slots__ = ("title", "description", "url", "source", "published_at")
+
+
+class NewsResult(Record):
+    """Articles returned by the news tool for a query."""
+
+    __slots__ = ("query", "total_results", "articles")
+
+
+class VerificationDetails(Record):
+    """Step counts and findings of a verification."""
+
+    __slots__ = ("total_steps", "successful_steps", "failed_steps", "findings")
+
+    @classmethod
+    def for_results(cls, results: List[Mapping], findings: Optional[List[str]] = None) -> "VerificationDetails":
+        """Build details with counts taken from the step results."""
+        if isinstance(findings, str):
+            findings = [findings]
+        return cls(
+            total_steps=len(results),
+            successful_steps=sum(1 for r in results if r.get("status") == "success"),
+            failed_steps=sum(1 for r in results if r.get("status") == "error"),
+            findings=list(findings or [])
+        )
+
+
+class Verification(Record):
+    """Final verified summary of a task."""
+
+    __slots__ = ("status", "summary", "details", "final_answer", "raw_results", "error")
+    _optional = frozenset({"raw_results", "error"})
+
+
+def to_plain(obj: Any) -> Any:
+    """
+    Convert records (recursively) to plain dicts and lists.
+
+    Also usable as the `default` hook of json.dumps.
+
+    Args:
+        obj: Record, mapping, list or scalar
+
+    Returns:
+        Plain JSON-compatible value
+    """
+    if isinstance(obj, Mapping):
+        return {key: to_plain(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [to_plain(value) for value in obj]
+    return obj
+
+
+def _encode(obj: Any, parts: List[str]) -> None:
+    """Append the JSON encoding of obj to parts."""
+    if isinstance(obj, str):
+        parts.append(encode_basestring_ascii(obj))
+    elif obj is None:
+        parts.append("null")
+    elif obj is True:
+        parts.append("true")
+    elif obj is False:
+        parts.append("false")
+    elif isinstance(obj, (int, float)):
+        parts.append(json.dumps(obj))
+    elif isinstance(obj, Record):
+        parts.append("{")
+        first = True
+        for field in obj.__slots__:
+            value = getattr(obj, field)
+            if value is None and field in obj._optional:
+                continue
+            if not first:
+                parts.append(",")
+            first = False
+            parts.append(encode_basestring_ascii(field))
+            parts.append(":")
+            _encode(value, parts)
+        parts.append("}")
+    elif isinstance(obj, Mapping):
+        parts.append("{")
+        for i, (key, value) in enumerate(obj.items()):
+            if i:
+                parts.append(",")
+            parts.append(encode_basestring_ascii(str(key)))
+            parts.append(":")
+            _encode(value, parts)
+        parts.append("}")
+    elif isinstance(obj, (list, tuple)):
+        parts.append("[")
+        for i, value in enumerate(obj):
+            if i:
+                parts.append(",")
+            _encode(value, parts)
+        parts.append("]")
+    else:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> str:
+    """
+    Encode records, dicts and lists as compact JSON.
+
+    Reads record slots directly instead of converting to dicts first.
+
+    Args:
+        obj: Value to encode
+
+    Returns:
+        JSON string
+    """
+    parts: List[str] = []
+    _encode(obj, parts)
+    return "".join(parts)
@@ -4,7 +4,17 @@ Provides a web interface for the multi-agent system.
 """
 
 import streamlit as st
-from main import AIOpsAssistant
+from main import get_assistant
+from records import to_plain
+from metrics import LLM_SECONDS, LLM_TOKENS, REGISTRY, STAGE_SECONDS, TASKS
+
+
+@st.cache_resource
+def load_assistant():
+    """Get the assistant shared by all sessions of this server process."""
+    assistant = get_assistant()
+    assistant.warm_up()
+    return assistant
 
 
 def display_plan(plan):
@@ -29,13 +39,41 @@ def display_execution(results):
             st.text(f"Input: {result['input']}")
             
             if result["status"] == "success":
-                st.json(result["result"])
+                st.json(to_plain(result["result"]))
             else:
                 st.error(f"Error: {result['error']}")
         
         st.divider()
 
 
+def display_metrics():
+    """Display live runtime metrics in the sidebar."""
+    st.header("📈 Live Metrics")
+    st.button("🔄 Refresh metrics", use_container_width=True)
+    
+    tasks = sum(TASKS.values().values())
+    st.metric("Tasks processed", int(tasks))
+    
+    for stage in ("planning", "execution", "verification"):
+        summary = STAGE_SECONDS.summary(stage=stage)
+        if summary["count"]:
+            st.markdown(f"**{stage.title()}**: avg {summary['avg']:.2f}s, p95 ≤ {summary['p95']:g}s")
+    
+    completion_tokens = sum(v for (_, kind), v in LLM_TOKENS.values().items() if kind == "completion")
+    llm_seconds = sum(state[-1] for state in LLM_SECONDS.values().values())
+    if llm_seconds:
+        st.markdown(f"**LLM throughput**: {completion_tokens / llm_seconds:.1f} tokens/s")
+    
+    for name, _, labels, value in REGISTRY.collect():
+        if name == "aiops_cache_hit_ratio":
+            st.markdown(f"**{labels['cache']} cache hit ratio**: {value:.0%}")
+        elif name == "aiops_http_pool_reuse_ratio":
+            st.markdown(f"**{labels['tool']} connection reuse**: {value:.0%}")
+    
+    with st.expander("Prometheus metrics", expanded=False):
+        st.code(REGISTRY.render(), language="text")
+
+
 def display_verification(verification):
     """Display verification results."""
     st.subheader("✅ Verification")
@@ -62,7 +100,7 @@ def display_verification(verification):
         
         if verification.get('final_answer'):
             st.markdown("**Final Answer**:")
-            st.json(verification['final_answer'])
+            st.json(to_plain(verification['final_answer']))
 
 
 def main():
@@ -101,8 +139,6 @@ def main():
         st.session_state.results = None
         st.session_state.verification = None
         st.session_state.plan = None
-        if 'assistant' in st.session_state:
-            del st.session_state.assistant
         st.rerun()
     
     # Example tasks
@@ -125,17 +161,11 @@ def main():
         st.subheader("🔄 Processing")
         
         try:
-            # Lazy import and initialization (only when needed)
-            global AIOpsAssistant
-            if AIOpsAssistant is None:
-                from main import AIOpsAssistant
-            
-            # Initialize assistant lazily (only when needed)
+            # Shared across sessions; only the first session pays for initialization
             if 'assistant' not in st.session_state:
                 with st.spinner("Initializing AI Operations Assistant..."):
                     try:
-                        st.session_state.assistant = AIOpsAssistant()
-                        st.success("✅ Assistant initialized successfully!")
+                        st.session_state.assistant = load_assistant()
                     except Exception as e:
                         st.error(f"❌ Failed to initialize: {e}")
                         st.error("Please ensure all required API keys are configured in Streamlit secrets.")
@@ -148,26 +178,32 @@ def main():
                         """)
                         st.stop()
             
-            # Planning phase
-            with st.spinner("📋 Creating execution plan..."):
-                plan = st.session_state.assistant.planner.create_plan(task)
-                st.session_state.plan = plan
-            
-            display_plan(plan)
+            assistant = st.session_state.assistant
+            profiler = assistant.profiler
             
-            # Execution phase
-            with st.spinner("⚙️ Executing plan..."):
-                results = st.session_state.assistant.executor.execute_plan(plan)
-                st.session_state.results = results
+            with profiler.task(task):
+                # Planning phase
+                with st.spinner("📋 Creating execution plan..."), profiler.stage("planning"), STAGE_SECONDS.time(stage="planning"):
+                    plan = assistant.planner.create_plan(task)
+                    st.session_state.plan = plan
+                
+                display_plan(plan)
+                
+                # Execution phase
+                with st.spinner("⚙️ Executing plan..."), profiler.stage("execution"), STAGE_SECONDS.time(stage="execution"):
+                    results = assistant.execute_plan(plan)
+                    st.session_state.results = results
+                
+                display_execution(results)
+                
+                # Verification phase
+                with st.spinner("✅ Verifying results..."), profiler.stage("verification"), STAGE_SECONDS.time(stage="verification"):
+                    verification = assistant.verifier.verify_results(results)
+                    st.session_state.verification = verification
+                
+                display_verification(verification)
             
-            display_execution(results)
-            
-            # Verification phase
-            with st.spinner("✅ Verifying results..."):
-                verification = st.session_state.assistant.verifier.verify_results(results)
-                st.session_state.verification = verification
-            
-            display_verification(verification)
+            TASKS.inc(status=verification["status"])
             
             # Success message
             st.success("✅ Task completed successfully!")
@@ -194,12 +230,19 @@ def main():
         st.header("🔧 System Info")
         
         if 'assistant' in st.session_state:
-            st.info(f"**Model**: {st.session_state.assistant.llm.model}")
+            router = st.session_state.assistant.router
+            st.info(
+                f"**Planner Model**: {router.model_for('planner')}\n\n"
+                f"**Verifier Model**: {router.model_for('verifier')}"
+            )
         else:
             st.info("Assistant not initialized yet")
         
         st.info("**Tools Available**: GitHub, Weather, News")
         
+        if 'assistant' in st.session_state:
+            display_metrics()
+        
         st.header("📖 About")
         st.markdown("""
         This system uses a multi-agent architecture:
@@ -0,0 +1,111 @@
+"""Tests for streamed JSON extraction, truncation repair and the re-ask fallback."""
+
+import pytest
+
+from agents.planner import PlannerAgent, validate_plan
+from cache.result_cache import RefreshingCache
+from cache.semantic_cache import SemanticCache
+from llm.json_extractor import (
+    IncrementalJSONExtractor, RepairedJSON, extract_json, repair_truncated_json
+)
+from llm.openrouter_client import OpenRouterClient
+
+
+def test_extractor_returns_object_once_it_closes():
+    extractor = IncrementalJSONExtractor()
+    chunks = ['{"steps": [{"tool": "weather', '_fetch", "input": "Paris"}', "]}", " trailing"]
+
+    results = [extractor.feed(chunk) for chunk in chunks]
+
+    assert results[:2] == [None, None]
+    assert results[2] == {"steps": [{"tool": "weather_fetch", "input": "Paris"}]}
+    assert not extractor.had_prose
+
+
+def test_extractor_skips_prose_fences_and_braces_in_strings():
+    text = 'Sure! {not json} ```json\n{"summary": "uses {braces} and \\"quotes\\""}\n```'
+
+    extractor = IncrementalJSONExtractor()
+
+    assert extractor.feed(text) == {"summary": 'uses {braces} and "quotes"'}
+    assert extractor.had_prose
+
+
+def test_extract_json_returns_none_without_object():
+    assert extract_json("no json here") is None
+
+
+def test_repair_never_completes_cut_off_string():
+    repaired = repair_truncated_json('{"steps": [{"tool": "weather_fetch", "input": "Mum')
+
+    assert repaired == {"steps": [{"tool": "weather_fetch"}]}
+    assert isinstance(repaired, RepairedJSON)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('{"a": 1, "b": 12', {"a": 1}),
+    ('{"a": "x, y", "b": tr', {"a": "x, y"}),
+    ('{"a": [1, 2', {"a": [1]}),
+    ('{"a": 1, "b": {"c": 2}', {"a": 1, "b": {"c": 2}}),
+    ('{"status": "ok", "summary": "Done"', {"status": "ok", "summary": "Done"}),
+    ('{"a": 1,  ', {"a": 1}),
+    ('{"a": "x\\"", "b": "q', {"a": 'x"'}),
+])
+def test_repair_trims_at_complete_member_boundaries(text, expected):
+    assert repair_truncated_json(text) == expected
+
+
+@pytest.mark.parametrize("text", ['{', '{"steps": [{"to', '{"input": "Mum'])
+def test_repair_gives_up_without_complete_member(text):
+    assert repair_truncated_json(text) is None
+
+
+def _client(streamed: str, continuation: str = "") -> OpenRouterClient:
+    client = OpenRouterClient(api_key="test", model="test-model", base_url="http://localhost")
+    client._stream_into = lambda messages, extractor, *args: extractor.feed(streamed)
+    client.call_llm = lambda *args, **kwargs: continuation
+    return client
+
+
+def test_invalid_repair_falls_back_to_reask():
+    client = _client(
+        '{"steps": [{"tool": "weather_fetch", "input": "Mum',
+        '{"steps": [{"tool": "weather_fetch", "input": "Mumbai"}]}'
+    )
+
+    plan = client.call_llm_with_json([], validate=validate_plan)
+
+    assert plan == {"steps": [{"tool": "weather_fetch", "input": "Mumbai"}]}
+    assert not isinstance(plan, RepairedJSON)
+    assert client.json_parse_stats()["reasked"] == 1
+
+
+def test_valid_repair_is_returned_as_repaired():
+    client = _client('{"steps": [{"tool": "weather_fetch", "input": "Paris"}, {"tool": "ne')
+
+    plan = client.call_llm_with_json([], validate=validate_plan)
+
+    assert plan == {"steps": [{"tool": "weather_fetch", "input": "Paris"}]}
+    assert isinstance(plan, RepairedJSON)
+    assert client.json_parse_stats()["repaired"] == 1
+
+
+def test_unrepairable_response_raises():
+    client = _client('{"steps": [{"to', "still not json")
+
+    with pytest.raises(ValueError):
+        client.call_llm_with_json([], validate=validate_plan)
+    assert client.json_parse_stats()["failed"] == 1
+
+
+def test_repaired_plan_is_not_cached():
+    client = _client('{"steps": [{"tool": "weather_fetch", "input": "Paris"}, {"tool": "ne')
+    plan_cache = SemanticCache()
+    result_cache = RefreshingCache()
+    planner = PlannerAgent(client, plan_cache, result_cache)
+
+    plan = planner.create_plan("weather in Paris and news")
+
+    assert plan.degraded
+    assert plan_cache.stats()["size"] == 0
+    assert result_cache.stats()["size"] == 0
@@ -0,0 +1,153 @@
+"""Tests for the metrics registry and LLM token accounting."""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import metrics
+from config import Config
+from llm.json_extractor import IncrementalJSONExtractor
+from llm.openrouter_client import OpenRouterClient
+from metrics import MetricsRegistry
+
+
+def test_counter_renders_per_label_set():
+    registry = MetricsRegistry()
+    counter = registry.counter("demo_total", "Demo events", ("status",))
+    counter.inc(status="ok")
+    counter.inc(2, status="ok")
+    counter.inc(status='bad "quote"')
+
+    lines = registry.render().splitlines()
+
+    assert lines[:2] == ["# HELP demo_total Demo events", "# TYPE demo_total counter"]
+    assert 'demo_total{status="ok"} 3' in lines
+    assert 'demo_total{status="bad \\"quote\\""} 1' in lines
+
+
+def test_counter_requires_declared_labels():
+    counter = MetricsRegistry().counter("demo_total", "Demo events", ("status",))
+
+    with pytest.raises(ValueError):
+        counter.inc(kind="x")
+
+
+def test_registry_returns_existing_metric_for_same_name():
+    registry = MetricsRegistry()
+
+    assert registry.counter("demo_total", "Demo") is registry.counter("demo_total", "Demo")
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("demo_seconds", "Demo latency", ("stage",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.7, 3.0):
+        histogram.observe(value, stage="plan")
+
+    lines = registry.render().splitlines()
+
+    assert "# TYPE demo_seconds histogram" in lines
+    assert 'demo_seconds_bucket{stage="plan",le="0.1"} 1' in lines
+    assert 'demo_seconds_bucket{stage="plan",le="1.0"} 3' in lines
+    assert 'demo_seconds_bucket{stage="plan",le="+Inf"} 4' in lines
+    assert 'demo_seconds_sum{stage="plan"} 4.25' in lines
+    assert 'demo_seconds_count{stage="plan"} 4' in lines
+
+
+def test_histogram_summary_uses_bucket_bounds():
+    histogram = MetricsRegistry().histogram("demo_seconds", "Demo latency", buckets=(0.1, 1.0))
+    for value in (0.05, 0.05, 0.5, 3.0):
+        histogram.observe(value)
+
+    summary = histogram.summary()
+
+    assert summary["count"] == 4
+    assert summary["p50"] == 0.1
+    assert summary["p95"] == float("inf")
+    assert summary["avg"] == pytest.approx(0.9)
+
+
+def test_collectors_render_as_gauges_and_failures_are_skipped():
+    registry = MetricsRegistry()
+    registry.register_collector("cache", lambda: [
+        ("demo_hit_ratio", "Hit ratio", {"cache": "plan"}, 0.5),
+        ("demo_hit_ratio", "Hit ratio", {"cache": "result"}, 0.25),
+    ])
+    registry.register_collector("broken", lambda: 1 / 0)
+
+    lines = registry.render().splitlines()
+
+    assert lines.count("# TYPE demo_hit_ratio gauge") == 1
+    assert 'demo_hit_ratio{cache="plan"} 0.5' in lines
+    assert 'demo_hit_ratio{cache="result"} 0.25' in lines
+
+
+def _chunk(content=None, usage=None):
+    choices = [] if content is None else [SimpleNamespace(delta=SimpleNamespace(content=content))]
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+class _Stream:
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self.closed = False
+
+    def __iter__(self):
+        return self._chunks
+
+    def close(self):
+        self.closed = True
+
+
+def _streaming_client(chunks, model):
+    client = OpenRouterClient(api_key="test", model=model, base_url="http://localhost")
+    requests = []
+
+    def create(**kwargs):
+        requests.append(kwargs)
+        return _Stream(chunks)
+
+    client._client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    return client, requests
+
+
+def _tokens(model):
+    return {kind: value for (m, kind), value in metrics.LLM_TOKENS.values().items() if m == model}
+
+
+def _wait_for_tokens(model):
+    deadline = time.time() + 2
+    while not _tokens(model) and time.time() < deadline:
+        time.sleep(0.01)
+    return _tokens(model)
+
+
+def test_stream_records_reported_usage():
+    usage = SimpleNamespace(prompt_tokens=120, completion_tokens=9)
+    client, requests = _streaming_client(
+        [_chunk('{"a": '), _chunk("1}"), _chunk("\n"), _chunk(usage=usage)], "usage-model"
+    )
+
+    client._stream_into([], IncrementalJSONExtractor(), 0, 100)
+
+    assert requests[0]["stream_options"] == {"include_usage": True}
+    assert _wait_for_tokens("usage-model") == {"prompt": 120, "completion": 9}
+
+
+def test_stream_without_usage_counts_chunks_separately():
+    client, _ = _streaming_client([_chunk('{"a": '), _chunk("1}")], "chunk-model")
+
+    client._stream_into([], IncrementalJSONExtractor(), 0, 100)
+
+    assert _wait_for_tokens("chunk-model") == {"completion_chunks": 2}
+
+
+def test_stream_usage_can_be_disabled(monkeypatch):
+    monkeypatch.setattr(Config, "LLM_STREAM_USAGE", False)
+    client, requests = _streaming_client([_chunk('{"a": 1}')], "no-usage-model")
+
+    client._stream_into([], IncrementalJSONExtractor(), 0, 100)
+
+    assert "stream_options" not in requests[0]
+    assert _tokens("no-usage-model") == {"completion_chunks": 1}
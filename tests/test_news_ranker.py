@@ -0,0 +1,81 @@
+"""Tests for news deduplication and ranking."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from records import NewsArticle
+from tools.news_ranker import NewsRanker
+
+
+NOW = datetime(2025, 1, 10, 12, tzinfo=timezone.utc).timestamp()
+
+
+def _article(title, source="Wire", hours_ago=1):
+    published = datetime.fromtimestamp(NOW - hours_ago * 3600, tz=timezone.utc)
+    return NewsArticle(
+        title=title,
+        description="",
+        url=f"https://example.com/{source.lower()}/{hours_ago}",
+        source=source,
+        published_at=published.strftime("%Y-%m-%dT%H:%M:%SZ")
+    )
+
+
+def test_near_duplicate_titles_keep_the_newest():
+    older = _article("OpenAI releases new reasoning model for developers", "Wire", hours_ago=5)
+    newer = _article("OpenAI releases new reasoning model for developers!", "Daily", hours_ago=1)
+    other = _article("Stock markets close higher on tech rally", "Markets", hours_ago=2)
+
+    ranked = NewsRanker().rank([older, other, newer], top_k=5, now=NOW)
+
+    assert newer in ranked
+    assert older not in ranked
+    assert other in ranked
+    assert len(ranked) == 2
+
+
+def test_distinct_titles_are_all_kept():
+    articles = [
+        _article("Rust 2.0 roadmap published", hours_ago=1),
+        _article("New battery chemistry doubles range", hours_ago=2),
+        _article("Central bank holds interest rates", hours_ago=3),
+    ]
+
+    assert len(NewsRanker().rank(articles, top_k=10, now=NOW)) == 3
+
+
+def test_untitled_articles_are_not_duplicates():
+    articles = [_article(None, hours_ago=h) for h in (1, 2, 3)] + [_article("", hours_ago=4)]
+
+    assert len(NewsRanker().rank(articles, top_k=10, now=NOW)) == 4
+
+
+def test_ranking_prefers_recent_and_diverse_sources():
+    articles = [
+        _article("Old story from the archive", "Wire", hours_ago=72),
+        _article("Fresh story about launches", "Wire", hours_ago=1),
+        _article("Another fresh story on chips", "Wire", hours_ago=1.5),
+        _article("Fresh story from elsewhere", "Daily", hours_ago=2),
+    ]
+
+    ranked = NewsRanker().rank(articles, top_k=3, now=NOW)
+
+    assert ranked[0].title == "Fresh story about launches"
+    assert ranked[1].source == "Daily"
+    assert "Old story from the archive" not in [a.title for a in ranked]
+
+
+@pytest.mark.parametrize("top_k", [0, -1])
+def test_non_positive_top_k_returns_nothing(top_k):
+    assert NewsRanker().rank([_article("Anything")], top_k=top_k, now=NOW) == []
+
+
+def test_empty_batch_returns_nothing():
+    assert NewsRanker().rank([], top_k=5, now=NOW) == []
+
+
+def test_top_k_limits_results():
+    articles = [_article(f"Story number {i} about topic {i * 7}", hours_ago=i + 1) for i in range(6)]
+
+    assert len(NewsRanker().rank(articles, top_k=2, now=NOW)) == 2
@@ -0,0 +1,133 @@
+"""Tests for merging tool calls across concurrent plans."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from agents.executor import ExecutorAgent
+from agents.plan_merger import PlanMerger
+
+
+class FakeExecutor(ExecutorAgent):
+    """Executor whose tools sleep and echo their input."""
+
+    def __init__(self, delay=0.2, failing=()):
+        super().__init__()
+        self.delay = delay
+        self.failing = set(failing)
+        self.calls = []
+        self._calls_lock = threading.Lock()
+
+    def _call_tool(self, tool_name, tool_input):
+        with self._calls_lock:
+            self.calls.append((tool_name, tool_input))
+        time.sleep(self.delay)
+        if tool_input in self.failing:
+            raise RuntimeError(f"{tool_input} unavailable")
+        return {"tool": tool_name, "input": tool_input}
+
+
+def _plan(*calls):
+    return {"steps": [{"tool": tool, "input": value} for tool, value in calls]}
+
+
+def _run_concurrently(merger, plans):
+    with ThreadPoolExecutor(max_workers=len(plans)) as pool:
+        futures = [pool.submit(merger.execute, plan) for plan in plans]
+        return [f.result() for f in futures]
+
+
+def test_shared_calls_run_once_and_fan_out():
+    executor = FakeExecutor()
+    merger = PlanMerger(executor, window=0.05)
+
+    first, second = _run_concurrently(merger, [
+        _plan(("weather_fetch", "Paris"), ("news_fetch", "ai")),
+        _plan(("news_fetch", "AI"), ("github_search", "python")),
+    ])
+
+    assert sorted(executor.calls) == [
+        ("github_search", "python"), ("news_fetch", "ai"), ("weather_fetch", "Paris")
+    ]
+    assert first[1]["result"] == {"tool": "news_fetch", "input": "ai"}
+    assert second[0]["result"] == {"tool": "news_fetch", "input": "ai"}
+    assert merger.stats()["fan_in_ratio"] == pytest.approx(4 / 3)
+
+
+def test_results_are_numbered_per_plan():
+    merger = PlanMerger(FakeExecutor(delay=0.01), window=0.05)
+
+    first, second = _run_concurrently(merger, [
+        _plan(("weather_fetch", "Paris"), ("news_fetch", "ai")),
+        _plan(("news_fetch", "ai"), ("weather_fetch", "Tokyo"), ("weather_fetch", "Paris")),
+    ])
+
+    assert [(r["step"], r["tool"], r["input"]) for r in first] == [
+        (1, "weather_fetch", "Paris"), (2, "news_fetch", "ai")
+    ]
+    assert [(r["step"], r["tool"], r["input"]) for r in second] == [
+        (1, "news_fetch", "ai"), (2, "weather_fetch", "Tokyo"), (3, "weather_fetch", "Paris")
+    ]
+
+
+def test_unique_calls_run_concurrently():
+    executor = FakeExecutor(delay=0.3)
+    merger = PlanMerger(executor, window=0.05)
+    plans = [_plan(("news_fetch", "ai"), ("weather_fetch", f"city{i}")) for i in range(10)]
+
+    start = time.perf_counter()
+    results = _run_concurrently(merger, plans)
+    elapsed = time.perf_counter() - start
+
+    assert len(executor.calls) == 11
+    assert all(r[1]["input"] == f"city{i}" for i, r in enumerate(results))
+    assert elapsed < 1.0
+    assert merger.stats()["added_latency_p95_ms"] < 300
+
+
+def test_batch_without_shared_calls_is_not_merged():
+    executor = FakeExecutor(delay=0.3)
+    merger = PlanMerger(executor, window=0.05)
+    plans = [_plan(("weather_fetch", f"city{i}")) for i in range(10)]
+
+    start = time.perf_counter()
+    results = _run_concurrently(merger, plans)
+    elapsed = time.perf_counter() - start
+
+    assert [r[0]["input"] for r in results] == [f"city{i}" for i in range(10)]
+    assert elapsed < 1.0
+    stats = merger.stats()
+    assert stats["merged_batches"] == 0
+    assert stats["added_latency_p95_ms"] < 300
+
+
+def test_tool_errors_reach_every_plan_that_asked():
+    executor = FakeExecutor(delay=0.01, failing={"Atlantis"})
+    merger = PlanMerger(executor, window=0.05)
+
+    first, second = _run_concurrently(merger, [
+        _plan(("weather_fetch", "Atlantis"), ("news_fetch", "ai")),
+        _plan(("news_fetch", "ai"), ("weather_fetch", "Atlantis")),
+    ])
+
+    assert first[0]["status"] == "error" and first[0]["step"] == 1
+    assert second[1]["status"] == "error" and second[1]["step"] == 2
+    assert first[0]["error"] == "Atlantis unavailable"
+    assert first[1]["status"] == second[0]["status"] == "success"
+
+
+def test_batch_failure_is_raised_in_every_task():
+    class BrokenExecutor(FakeExecutor):
+        def execute_step(self, step_number, tool_name, tool_input):
+            raise RuntimeError("executor down")
+
+    merger = PlanMerger(BrokenExecutor(), window=0.05)
+    plans = [_plan(("news_fetch", "ai")), _plan(("news_fetch", "ai"))]
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(merger.execute, plan) for plan in plans]
+        for future in futures:
+            with pytest.raises(RuntimeError, match="executor down"):
+                future.result()
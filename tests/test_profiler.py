@@ -0,0 +1,84 @@
+"""Tests for the opt-in pipeline profiler."""
+
+import cProfile
+import json
+import os
+import threading
+
+from profiler import PipelineProfiler
+
+
+def _reports(directory):
+    return [name for name in os.listdir(directory) if name.endswith(".json")]
+
+
+def test_disabled_profiler_is_a_no_op(tmp_path):
+    profiler = PipelineProfiler(enabled=False, output_dir=str(tmp_path))
+
+    with profiler.task("weather in Paris"):
+        with profiler.stage("planning"):
+            pass
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_task_writes_profile_and_stage_report(tmp_path):
+    profiler = PipelineProfiler(enabled=True, output_dir=str(tmp_path), sample_interval=0.001)
+
+    with profiler.task("weather in Paris"):
+        with profiler.stage("planning"):
+            data = [bytearray(1000) for _ in range(100)]
+        del data
+
+    files = os.listdir(tmp_path)
+    assert any(name.endswith(".prof") for name in files)
+    assert "collapsed.txt" in files
+    with open(tmp_path / _reports(tmp_path)[0]) as f:
+        report = json.load(f)
+    assert report["cprofile"] is True
+    assert report["stages"][0]["stage"] == "planning"
+    assert report["stages"][0]["overlapping_tasks"] is False
+
+
+def test_task_runs_without_cprofile_when_another_profiler_is_active(tmp_path, monkeypatch):
+    def busy(self):
+        raise ValueError("Another profiling tool is already active")
+
+    monkeypatch.setattr(cProfile.Profile, "enable", busy)
+    profiler = PipelineProfiler(enabled=True, output_dir=str(tmp_path), sample_interval=0.001)
+
+    with profiler.task("weather in Paris"):
+        with profiler.stage("planning"):
+            pass
+
+    assert not any(name.endswith(".prof") for name in os.listdir(tmp_path))
+    with open(tmp_path / _reports(tmp_path)[0]) as f:
+        assert json.load(f)["cprofile"] is False
+
+
+def test_overlapping_tasks_all_complete(tmp_path):
+    profiler = PipelineProfiler(enabled=True, output_dir=str(tmp_path), sample_interval=0.001)
+    barrier = threading.Barrier(3)
+    errors = []
+
+    def run(i):
+        try:
+            with profiler.task(f"task {i}"):
+                with profiler.stage("execution"):
+                    barrier.wait(timeout=5)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(_reports(tmp_path)) == 3
+    for name in _reports(tmp_path):
+        with open(tmp_path / name) as f:
+            stage = json.load(f)["stages"][0]
+        assert stage["overlapping_tasks"] is True
+        assert stage["memory_peak_bytes"] is None
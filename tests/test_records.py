@@ -0,0 +1,99 @@
+"""Tests for slotted records and their JSON encoding."""
+
+import copy
+import json
+import pickle
+
+import pytest
+
+from records import (
+    GitHubRepo, Plan, PlanStep, StepResult, Verification, VerificationDetails,
+    WeatherReport, dumps, to_plain
+)
+
+
+def test_record_behaves_like_a_mapping():
+    report = WeatherReport("Paris", 21.5, "Sunny")
+
+    assert report["city"] == "Paris"
+    assert report.get("condition") == "Sunny"
+    assert report.get("missing", "default") == "default"
+    assert dict(report) == {"city": "Paris", "temperature_c": 21.5, "condition": "Sunny"}
+    assert {**report}["temperature_c"] == 21.5
+    assert len(report) == 3
+    assert report == {"city": "Paris", "temperature_c": 21.5, "condition": "Sunny"}
+
+
+def test_record_has_no_instance_dict():
+    assert not hasattr(WeatherReport("Paris", 21.5, "Sunny"), "__dict__")
+
+
+def test_optional_fields_are_hidden_while_none():
+    ok = StepResult(step=1, tool="weather_fetch", input="Paris", status="success", result={"a": 1})
+    failed = StepResult(step=2, tool="weather_fetch", input="Paris", status="error", error="boom")
+
+    assert "error" not in ok and "result" in ok
+    assert "result" not in failed
+    with pytest.raises(KeyError):
+        failed["result"]
+    assert list(failed) == ["step", "tool", "input", "status", "error"]
+
+
+def test_setitem_only_accepts_fields():
+    repo = GitHubRepo("a", 1, "u", "d")
+    repo["stars"] = 2
+
+    assert repo.stars == 2
+    with pytest.raises(KeyError):
+        repo["unknown"] = 1
+
+
+def test_plan_from_dict_and_degraded_flag():
+    plan = Plan.from_dict({"steps": [{"tool": "weather_fetch", "input": "Paris"}]})
+    repaired = Plan.from_dict({"steps": []}, degraded=True)
+
+    assert plan["steps"][0] == {"tool": "weather_fetch", "input": "Paris"}
+    assert not plan.degraded and "degraded" not in plan
+    assert repaired["degraded"] is True
+
+
+def test_verification_details_counts_come_from_results():
+    results = [
+        StepResult(1, "weather_fetch", "Paris", "success", {"a": 1}),
+        StepResult(2, "news_fetch", "ai", "error", error="boom"),
+    ]
+
+    details = VerificationDetails.for_results(results, "one finding")
+
+    assert dict(details) == {
+        "total_steps": 2, "successful_steps": 1, "failed_steps": 1, "findings": ["one finding"]
+    }
+
+
+def test_dumps_matches_json_of_plain_values():
+    verification = Verification(
+        status="success",
+        summary='Quotes " and unicode é',
+        details=VerificationDetails.for_results([], []),
+        final_answer={"structured_data": {"repo": GitHubRepo("x", 5, "u", None), "nums": (1, 2.5)}},
+        raw_results=[StepResult(1, "github_search", "x", "success", GitHubRepo("x", 5, "u", None))]
+    )
+
+    encoded = dumps(verification)
+
+    assert json.loads(encoded) == to_plain(verification)
+    assert "error" not in json.loads(encoded)
+    assert verification.to_json() == encoded
+    assert json.dumps(verification, default=to_plain)
+
+
+def test_dumps_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        dumps({"when": object()})
+
+
+def test_records_copy_and_pickle():
+    plan = Plan([PlanStep("weather_fetch", "Paris")])
+
+    assert copy.deepcopy(plan) == plan
+    assert pickle.loads(pickle.dumps(plan)) == plan
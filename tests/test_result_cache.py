@@ -0,0 +1,151 @@
+"""Tests for the stale-while-revalidate result cache."""
+
+import threading
+import time
+
+from cache.result_cache import RateLimiter, RefreshingCache
+
+
+class CountingLoader:
+    """Loader returning an increasing number, optionally signalling each call."""
+
+    def __init__(self):
+        self.calls = 0
+        self.called = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        self.called.set()
+        return self.calls
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_hit_within_ttl_and_reload_after_expiry():
+    cache = RefreshingCache(ttls={"weather_fetch": 0.1}, quotas={}, min_hits=100)
+    loader = CountingLoader()
+
+    assert cache.get_or_load("weather_fetch", "paris", loader) == 1
+    assert cache.get_or_load("weather_fetch", "paris", loader) == 1
+    time.sleep(0.15)
+    assert cache.get_or_load("weather_fetch", "paris", loader) == 2
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+
+
+def test_zero_ttl_namespace_is_not_cached():
+    cache = RefreshingCache(ttls={}, quotas={})
+    loader = CountingLoader()
+
+    cache.get_or_load("unknown", "key", loader)
+    cache.get_or_load("unknown", "key", loader)
+
+    assert loader.calls == 2
+    assert cache.stats()["size"] == 0
+
+
+def test_hot_stale_entry_is_served_and_refreshed_in_background():
+    cache = RefreshingCache(ttls={"github_search": 0.5}, quotas={}, refresh_at=0.2, min_hits=1)
+    loader = CountingLoader()
+    cache.get_or_load("github_search", "ai", loader)
+    cache.get_or_load("github_search", "ai", loader)
+    time.sleep(0.15)
+
+    # Past the refresh threshold: served immediately, refreshed in the background
+    assert cache.get_or_load("github_search", "ai", loader) == 1
+    assert _wait_for(lambda: cache.stats()["refreshes"] == 1)
+    assert cache.get_or_load("github_search", "ai", loader) == 2
+    assert cache.stats()["stale_hits"] == 1
+
+
+def test_cold_entry_is_not_refreshed():
+    cache = RefreshingCache(ttls={"news_fetch": 0.5}, quotas={}, refresh_at=0.1, min_hits=5)
+    loader = CountingLoader()
+    cache.get_or_load("news_fetch", "ai", loader)
+    time.sleep(0.1)
+
+    cache.get_or_load("news_fetch", "ai", loader)
+
+    assert cache.stats()["refresh_queue"] == 0
+    assert loader.calls == 1
+
+
+def test_refresh_uses_refresher_and_respects_cacheable():
+    cache = RefreshingCache(ttls={"plan": 0.5}, quotas={}, refresh_at=0.1, min_hits=1)
+    cache.get_or_load(
+        "plan", "task", lambda: "good",
+        refresher=lambda: "degraded",
+        cacheable=lambda value: value != "degraded"
+    )
+    time.sleep(0.1)
+    cache.get_or_load("plan", "task", lambda: "unused")
+
+    assert _wait_for(lambda: cache.stats()["refresh_failures"] == 1)
+    assert cache.get_or_load("plan", "task", lambda: "unused") == "good"
+
+
+def test_uncacheable_value_is_returned_but_not_stored():
+    cache = RefreshingCache(ttls={"plan": 60}, quotas={})
+
+    value = cache.get_or_load("plan", "task", lambda: "degraded", cacheable=lambda v: False)
+
+    assert value == "degraded"
+    assert cache.stats()["size"] == 0
+
+
+def test_zero_quota_namespace_is_never_scheduled_for_refresh():
+    cache = RefreshingCache(ttls={"news_fetch": 0.5}, quotas={"news_fetch": 0}, refresh_at=0.1, min_hits=1)
+    loader = CountingLoader()
+    for _ in range(3):
+        cache.get_or_load("news_fetch", "ai", loader)
+        time.sleep(0.06)
+
+    stats = cache.stats()
+    assert stats["refresh_queue"] == 0
+    assert stats["stale_hits"] == 0
+    assert loader.calls == 1
+
+
+def test_refresher_keeps_running_when_a_quota_is_exhausted():
+    cache = RefreshingCache(
+        ttls={"news_fetch": 0.5, "weather_fetch": 0.5},
+        quotas={"news_fetch": 0.001, "weather_fetch": 600},
+        refresh_at=0.1, min_hits=1
+    )
+    cache.limiters["news_fetch"].tokens = 0
+    news, weather = CountingLoader(), CountingLoader()
+    for _ in range(2):
+        cache.get_or_load("news_fetch", "ai", news)
+        cache.get_or_load("weather_fetch", "paris", weather)
+    time.sleep(0.1)
+    cache.get_or_load("news_fetch", "ai", news)
+    cache.get_or_load("weather_fetch", "paris", weather)
+
+    # News stays queued behind its quota; weather is still refreshed
+    assert _wait_for(lambda: weather.calls == 2)
+    assert cache._worker.is_alive()
+    assert news.calls == 1
+
+
+def test_rate_limiter_tokens_refill():
+    limiter = RateLimiter(per_minute=6000)
+    limiter.tokens = 0
+
+    assert not limiter.try_acquire()
+    time.sleep(0.02)
+    assert limiter.try_acquire()
+
+
+def test_exhausted_zero_quota_waits_forever():
+    limiter = RateLimiter(per_minute=0)
+    limiter.consume()
+
+    assert limiter.wait_time() == float("inf")
@@ -0,0 +1,122 @@
+"""Tests for model routing and hedged LLM calls."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from config import Config
+from llm.openrouter_client import OpenRouterClient
+from llm.router import LatencyTracker, ModelRouter
+
+
+class FakeClient(OpenRouterClient):
+    """Client whose calls sleep per model and return (or raise) canned answers."""
+
+    def __init__(self, base_url, delays, failures=()):
+        super().__init__(api_key="test", model="primary", base_url=base_url)
+        self.delays = delays
+        self.failures = set(failures)
+        self.calls = []
+
+    def call_llm(self, messages, *args, model=None, **kwargs):
+        self.calls.append(model)
+        time.sleep(self.delays.get(model, 0))
+        if model in self.failures:
+            raise RuntimeError(f"{model} failed")
+        return f"answer from {model}"
+
+    def _stream_into(self, messages, extractor, temperature, max_tokens, model=None):
+        extractor.feed(self.call_llm(messages, model=model).replace("answer from ", '{"model": "') + '"}')
+
+
+def _router(delays, failures=(), hedge_delay=0.1):
+    client = FakeClient("http://primary", delays, failures)
+    hedge_client = FakeClient("http://hedge", delays, failures)
+    router = ModelRouter(client, hedge_client=hedge_client, tiers={"planner": "primary"}, hedge_model="hedge")
+    router.hedge_delay = lambda key: hedge_delay
+    return router
+
+
+def test_latency_tracker_percentiles_and_window():
+    tracker = LatencyTracker(window=4)
+    for seconds in (0.5, 0.1, 0.2, 0.3, 0.4):
+        tracker.record("m", seconds)
+
+    assert tracker.count("m") == 4
+    assert tracker.percentile("m", 0) == 0.1
+    assert tracker.percentile("m", 50) == 0.3
+    assert tracker.percentile("m", 100) == 0.4
+    assert tracker.percentile("other", 50) is None
+    assert tracker.models() == ["m"]
+
+
+def test_hedge_delay_uses_tracked_percentile_once_warm():
+    router = ModelRouter(FakeClient("http://primary", {}), hedge_model=None)
+
+    assert router.hedge_delay("primary") == Config.HEDGE_DEFAULT_DELAY
+    for i in range(Config.HEDGE_MIN_SAMPLES):
+        router.latency.record("primary", 0.01 * (i + 1))
+    assert router.hedge_delay("primary") == router.latency.percentile("primary", Config.HEDGE_PERCENTILE)
+
+
+def test_fast_primary_is_not_hedged():
+    router = _router({"primary": 0.01, "hedge": 0.01})
+
+    assert router.call("planner", "call_llm", []) == "answer from primary"
+    assert router.hedge_client.calls == []
+    assert router.stats()["hedged"] == 0
+
+
+def test_slow_primary_is_hedged_and_first_success_wins():
+    router = _router({"primary": 0.5, "hedge": 0.01})
+
+    assert router.call("planner", "call_llm", []) == "answer from hedge"
+    stats = router.stats()
+    assert stats["hedged"] == 1
+    assert stats["hedge_wins"] == 1
+
+
+def test_primary_still_wins_if_it_finishes_first():
+    router = _router({"primary": 0.2, "hedge": 0.6})
+
+    assert router.call("planner", "call_llm", []) == "answer from primary"
+    assert router.stats()["hedge_wins"] == 0
+
+
+def test_failed_hedge_falls_back_to_primary():
+    router = _router({"primary": 0.3, "hedge": 0.01}, failures={"hedge"})
+
+    assert router.call("planner", "call_llm", []) == "answer from primary"
+
+
+def test_error_when_both_calls_fail():
+    router = _router({"primary": 0.3, "hedge": 0.01}, failures={"primary", "hedge"})
+
+    with pytest.raises(RuntimeError, match="failed"):
+        router.call("planner", "call_llm", [])
+
+
+def test_hedging_does_not_cap_concurrency():
+    router = _router({"primary": 0.3, "hedge": 0.3}, hedge_delay=10.0)
+    calls = 4 * Config.HEDGE_POOL_SIZE
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=calls) as pool:
+        answers = list(pool.map(lambda _: router.call("planner", "call_llm", []), range(calls)))
+    elapsed = time.perf_counter() - start
+
+    assert answers == ["answer from primary"] * calls
+    assert elapsed < 0.9
+
+
+def test_json_outcome_is_counted_once_per_hedged_call():
+    router = _router({"primary": 0.3, "hedge": 0.01})
+
+    assert router.call("planner", "call_llm_with_json", []) == {"model": "hedge"}
+    time.sleep(0.4)
+
+    stats = router.client.json_parse_stats()
+    assert stats["calls"] == 1
+    assert stats["direct"] == 1
+    assert router.hedge_client.json_parse_stats()["calls"] == 0
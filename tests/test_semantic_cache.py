@@ -0,0 +1,127 @@
+"""Tests for the semantic plan cache."""
+
+import pytest
+
+from cache.semantic_cache import SemanticCache, extract_entities, extract_tool_intents
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("weather in York", {"york"}),
+    ("Weather in New York", {"new", "york"}),
+    ("weather in new york", {"new", "york"}),
+    ("New Delhi weather now", {"new", "delhi"}),
+    ("latest IT news", {"it"}),
+    ("news about the US economy", {"us", "economy"}),
+    ("latest news", set()),
+    ("What's the weather in Mumbai right now?", {"mumbai"}),
+    ("current Mumbai weather", {"mumbai"}),
+    ("Find top AI GitHub repo and current weather in Mumbai", {"ai", "mumbai"}),
+])
+def test_extract_entities(text, expected):
+    assert extract_entities(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("What's the weather in Mumbai?", {"weather_fetch"}),
+    ("Mumbai temperature and forecast", {"weather_fetch"}),
+    ("news and weather for Mumbai", {"weather_fetch", "news_fetch"}),
+    ("Find top AI GitHub repo", {"github_search"}),
+    ("Find top AI repositories, weather in Paris, and AI headlines",
+     {"github_search", "weather_fetch", "news_fetch"}),
+    ("Mumbai", set()),
+])
+def test_extract_tool_intents(text, expected):
+    assert extract_tool_intents(text) == expected
+
+
+def test_get_reuses_plan_for_paraphrase():
+    cache = SemanticCache()
+    cache.put("weather in Mumbai now", {"steps": [{"tool": "weather_fetch", "input": "Mumbai"}]})
+
+    hit = cache.get("current Mumbai weather")
+
+    assert hit is not None
+    plan, similarity = hit
+    assert plan["steps"][0]["input"] == "Mumbai"
+    assert similarity >= cache.threshold
+
+
+@pytest.mark.parametrize("cached, query", [
+    ("weather in York", "weather in New York"),
+    ("weather in York", "Weather in New York"),
+    ("weather in New York", "weather in York"),
+    ("weather in Delhi", "weather in New Delhi"),
+    ("latest news", "latest IT news"),
+    ("weather in Mumbai", "weather in London"),
+    ("weather in Mumbai", "weather and news in Mumbai"),
+    ("weather in Mumbai", "news and weather for Mumbai"),
+    ("weather and news in Mumbai", "weather in Mumbai"),
+    ("top AI github repo", "latest AI news"),
+])
+def test_get_requires_exact_entities(cached, query):
+    cache = SemanticCache()
+    cache.put(cached, {"task": cached})
+
+    assert cache.get(query) is None
+
+
+def test_get_matches_multi_word_city_regardless_of_case():
+    cache = SemanticCache()
+    cache.put("Weather in New York", {"city": "New York"})
+
+    hit = cache.get("weather in new york")
+
+    assert hit is not None
+    assert hit[0] == {"city": "New York"}
+
+
+def test_get_returns_a_copy():
+    cache = SemanticCache()
+    cache.put("weather in Paris", {"steps": []})
+
+    cache.get("weather in Paris")[0]["steps"].append("mutated")
+
+    assert cache.get("weather in Paris")[0] == {"steps": []}
+
+
+def test_full_index_overwrites_oldest_entry():
+    cache = SemanticCache(max_entries=2)
+    cache.put("weather in Paris", "paris")
+    cache.put("weather in Tokyo", "tokyo")
+    cache.put("weather in Berlin", "berlin")
+
+    assert cache.get("weather in Paris") is None
+    assert cache.get("weather in Tokyo")[0] == "tokyo"
+    assert cache.get("weather in Berlin")[0] == "berlin"
+    assert cache.stats()["size"] == 2
+
+
+def test_put_same_text_overwrites_its_row():
+    cache = SemanticCache()
+    cache.put("weather in Paris", "old plan")
+    cache.put("Weather in  Paris", "refreshed plan")
+
+    assert cache.stats()["size"] == 1
+    assert cache.get("weather in Paris")[0] == "refreshed plan"
+
+
+def test_overwritten_oldest_row_can_be_stored_again():
+    cache = SemanticCache(max_entries=2)
+    cache.put("weather in Paris", "paris")
+    cache.put("weather in Tokyo", "tokyo")
+    cache.put("weather in Berlin", "berlin")
+    cache.put("weather in Paris", "paris again")
+
+    assert cache.stats()["size"] == 2
+    assert cache.get("weather in Paris")[0] == "paris again"
+    assert cache.get("weather in Tokyo") is None
+
+
+def test_get_matches_same_tools_in_any_order():
+    cache = SemanticCache()
+    cache.put("weather and news in Mumbai", {"tools": ["weather_fetch", "news_fetch"]})
+
+    hit = cache.get("news and weather in Mumbai")
+
+    assert hit is not None
+    assert hit[0] == {"tools": ["weather_fetch", "news_fetch"]}
@@ -0,0 +1,147 @@
+"""Tests for incremental verification with cached per-step summaries."""
+
+import re
+
+from agents.verifier import VerifierAgent
+from llm.json_extractor import RepairedJSON
+from records import StepResult
+
+
+class FakeLLM:
+    """Summarizes every step named in the prompt, like the mock upstream."""
+
+    def __init__(self, repaired=False, data_key=None):
+        self.repaired = repaired
+        self.data_key = data_key
+        self.prompts = []
+
+    def call_llm_with_json(self, messages, validate=None):
+        prompt = messages[-1]["content"]
+        self.prompts.append(prompt)
+        steps = []
+        for number, tool, value in re.findall(r"Step (\d+):\n  Tool: (\S+)\n  Input: (.*)", prompt):
+            steps.append({
+                "step": int(number),
+                "summary": f"{tool} for {value}.",
+                "findings": [f"{tool} ok"],
+                "data": {self.data_key or f"{tool}_{value}": f"{tool} {value}"}
+            })
+        response = (RepairedJSON if self.repaired else dict)({"steps": steps})
+        if validate is not None:
+            validate(response)
+        return response
+
+
+def _ok(step, tool, value):
+    return StepResult(step, tool, value, "success", {"value": value})
+
+
+def test_all_steps_summarized_in_one_call():
+    llm = FakeLLM()
+    verifier = VerifierAgent(llm)
+
+    verification = verifier.verify_results([_ok(1, "weather_fetch", "Paris"), _ok(2, "news_fetch", "ai")])
+
+    assert verification.status == "success"
+    assert verification.summary == "weather_fetch for Paris. news_fetch for ai."
+    assert verification.final_answer == {
+        "structured_data": {"weather_fetch_Paris": "weather_fetch Paris", "news_fetch_ai": "news_fetch ai"}
+    }
+    assert len(llm.prompts) == 1
+
+
+def test_cached_and_fresh_summaries_merge_in_step_order():
+    llm = FakeLLM()
+    verifier = VerifierAgent(llm)
+    verifier.verify_results([_ok(1, "weather_fetch", "Paris")])
+
+    verification = verifier.verify_results([_ok(1, "news_fetch", "ai"), _ok(2, "weather_fetch", "Paris")])
+
+    assert verification.summary == "news_fetch for ai. weather_fetch for Paris."
+    assert verification.details["findings"] == ["news_fetch ok", "weather_fetch ok"]
+    # Only the new step is sent, under its position in this plan
+    assert "Step 1:\n  Tool: news_fetch" in llm.prompts[-1]
+    assert "weather_fetch" not in llm.prompts[-1]
+    assert verifier.stats()["steps_cached"] == 1
+
+
+def test_repeated_task_makes_no_llm_call():
+    llm = FakeLLM()
+    verifier = VerifierAgent(llm)
+    results = [_ok(1, "weather_fetch", "Paris"), _ok(2, "github_search", "python")]
+
+    first = verifier.verify_results(results)
+    second = verifier.verify_results(results)
+
+    assert len(llm.prompts) == 1
+    assert second.summary == first.summary
+    assert verifier.stats()["hit_ratio"] == 0.5
+
+
+def test_changed_result_is_summarized_again():
+    llm = FakeLLM()
+    verifier = VerifierAgent(llm)
+    verifier.verify_results([_ok(1, "weather_fetch", "Paris")])
+
+    changed = StepResult(1, "weather_fetch", "Paris", "success", {"value": "Rain"})
+    verifier.verify_results([changed])
+
+    assert len(llm.prompts) == 2
+
+
+def test_error_steps_skip_the_llm():
+    llm = FakeLLM()
+    verifier = VerifierAgent(llm)
+    failed = StepResult(2, "news_fetch", "ai", "error", error="timeout")
+
+    verification = verifier.verify_results([_ok(1, "weather_fetch", "Paris"), failed])
+
+    assert verification.status == "partial"
+    assert "Step 2 (news_fetch) failed: timeout." in verification.summary
+    assert "news_fetch" not in llm.prompts[-1]
+
+    only_failed = verifier.verify_results([failed])
+    assert only_failed.status == "failed"
+    assert len(llm.prompts) == 1
+
+
+def test_repaired_summaries_are_not_cached():
+    llm = FakeLLM(repaired=True)
+    verifier = VerifierAgent(llm)
+    results = [_ok(1, "weather_fetch", "Paris")]
+
+    verifier.verify_results(results)
+    verification = verifier.verify_results(results)
+
+    assert verification.status == "success"
+    assert len(llm.prompts) == 2
+    assert verifier.stats()["size"] == 0
+
+
+def test_cache_evicts_least_recently_used():
+    verifier = VerifierAgent(FakeLLM(), cache_size=2)
+    for city in ("Paris", "London", "Tokyo"):
+        verifier.verify_results([_ok(1, "weather_fetch", city)])
+
+    assert verifier.stats()["size"] == 2
+
+
+def test_same_data_key_from_separate_calls_is_not_overwritten():
+    llm = FakeLLM(data_key="weather")
+    verifier = VerifierAgent(llm)
+    verifier.verify_results([_ok(1, "weather_fetch", "Paris")])
+
+    verification = verifier.verify_results([_ok(1, "weather_fetch", "Paris"), _ok(2, "weather_fetch", "London")])
+
+    assert verification.final_answer["structured_data"] == {
+        "weather (step 1: Paris)": "weather_fetch Paris",
+        "weather (step 2: London)": "weather_fetch London"
+    }
+
+
+def test_same_data_key_with_equal_values_is_kept_once():
+    verifier = VerifierAgent(FakeLLM(data_key="weather"))
+
+    verification = verifier.verify_results([_ok(1, "weather_fetch", "Paris"), _ok(2, "weather_fetch", "Paris")])
+
+    assert verification.final_answer["structured_data"] == {"weather": "weather_fetch Paris"}
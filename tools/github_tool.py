@@ -3,9 +3,8 @@ GitHub Tool for AI Operations Assistant.
 Searches GitHub repositories using the GitHub Search API.
 """
 
-import requests
-from typing import Dict, Any
 from config import Config
+from records import GitHubRepo
 
 
 class GitHubTool:
@@ -14,8 +13,17 @@ class GitHubTool:
     def __init__(self):
         """Initialize GitHub tool."""
         self.api_url = Config.GITHUB_API_URL
+        self._session = None
     
-    def search_repositories(self, query: str) -> Dict[str, Any]:
+    @property
+    def session(self):
+        """HTTP session (connection pool), created on first use."""
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session
+    
+    def search_repositories(self, query: str) -> GitHubRepo:
         """
         Search GitHub repositories for a given query.
         
@@ -23,35 +31,37 @@ class GitHubTool:
             query: Search query string
             
         Returns:
-            Dictionary containing top repository information
+            Record containing top repository information
             
         Raises:
             RuntimeError: If API call fails
         """
         params = {"q": query, "sort": "stars", "per_page": 1}
         
+        import requests
+        
         try:
-            response = requests.get(self.api_url, params=params, timeout=10)
+            response = self.session.get(self.api_url, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
             
             if not data.get("items"):
-                return {
-                    "name": "No results",
-                    "stars": "0",
-                    "url": "",
-                    "description": "No repositories found"
-                }
+                return GitHubRepo(
+                    name="No results",
+                    stars=0,
+                    url="",
+                    description="No repositories found"
+                )
             
             repo = data["items"][0]
             
-            return {
-                "name": repo.get("name", ""),
-                "stars": str(repo.get("stargazers_count", 0)),
-                "url": repo.get("html_url", ""),
-                "description": repo.get("description", "")
-            }
+            return GitHubRepo(
+                name=repo.get("name", ""),
+                stars=int(repo.get("stargazers_count") or 0),
+                url=repo.get("html_url", ""),
+                description=repo.get("description", "")
+            )
             
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"GitHub API request failed: {e}")
@@ -0,0 +1,204 @@
+"""
+News ranking for AI Operations Assistant.
+Columnar (NumPy) post-processing of fetched articles: drops near-duplicate
+titles with MinHash over byte shingles, then ranks by recency and source
+diversity and keeps only the top K.
+"""
+
+import re
+from datetime import datetime
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from config import Config
+from records import NewsArticle
+
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+# Shingle size in bytes; each shingle packs into one uint32
+SHINGLE_SIZE = 4
+
+
+def _normalize_title(title: Optional[str], index: int) -> bytes:
+    """Lowercase a title, strip punctuation, and pad it to one full shingle."""
+    normalized = _NON_WORD.sub(" ", (title or "").lower()).strip()
+    if not normalized:
+        # Untitled articles never count as duplicates of each other
+        normalized = f"#{index}"
+    return normalized.ljust(SHINGLE_SIZE).encode("utf-8")
+
+
+def _parse_published(values: Sequence[Optional[str]]) -> np.ndarray:
+    """Parse ISO timestamps to epoch seconds (NaN when missing or invalid)."""
+    cleaned = [(v or "").rstrip("Z") or "NaT" for v in values]
+    try:
+        parsed = np.array(cleaned, dtype="datetime64[s]")
+    except ValueError:
+        parsed = np.empty(len(cleaned), dtype="datetime64[s]")
+        for i, value in enumerate(values):
+            try:
+                dt = datetime.fromisoformat((value or "").replace("Z", "+00:00"))
+                parsed[i] = np.datetime64(int(dt.timestamp()), "s")
+            except ValueError:
+                parsed[i] = np.datetime64("NaT")
+
+    seconds = parsed.astype("int64").astype(np.float64)
+    seconds[np.isnat(parsed)] = np.nan
+    return seconds
+
+
+class NewsRanker:
+    """Deduplicates and ranks article batches with vectorized NumPy operations."""
+
+    def __init__(
+        self,
+        num_hashes: int = 48,
+        bands: int = 8,
+        half_life_hours: float = Config.NEWS_RECENCY_HALF_LIFE_HOURS,
+        source_penalty: float = Config.NEWS_SOURCE_PENALTY,
+        seed: int = 7
+    ):
+        """
+        Initialize news ranker.
+
+        Args:
+            num_hashes: MinHash signature length
+            bands: LSH bands; titles sharing any band are duplicates
+                (num_hashes / bands rows each, ~0.7 Jaccard threshold by default)
+            half_life_hours: Age at which the recency score halves
+            source_penalty: Score multiplier for each earlier article from the same source
+            seed: Seed for the hash functions
+        """
+        if num_hashes % bands:
+            raise ValueError("num_hashes must be divisible by bands")
+
+        self.bands = bands
+        self.rows = num_hashes // bands
+        self.half_life_hours = half_life_hours
+        self.source_penalty = source_penalty
+
+        rng = np.random.default_rng(seed)
+        # Multiply-shift hashing: odd 64-bit multipliers, high 32 bits kept
+        self._mult = rng.integers(1, 2 ** 63, size=num_hashes, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._add = rng.integers(0, 2 ** 63, size=num_hashes, dtype=np.uint64)
+        self._band_mix = rng.integers(1, 2 ** 63, size=self.rows, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+
+    def signatures(self, titles: Sequence[Optional[str]]) -> np.ndarray:
+        """
+        Compute MinHash signatures of titles.
+
+        Args:
+            titles: Article titles
+
+        Returns:
+            uint64 array of shape (len(titles), num_hashes)
+        """
+        encoded = [_normalize_title(t, i) for i, t in enumerate(titles)]
+        lengths = np.fromiter((len(e) for e in encoded), dtype=np.int64, count=len(encoded))
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint32)
+
+        # Pack every 4-byte window into one uint32 shingle
+        shingles = (
+            (data[:-3] << np.uint32(24)) | (data[1:-2] << np.uint32(16))
+            | (data[2:-1] << np.uint32(8)) | data[3:]
+        )
+
+        # Drop windows that straddle two titles
+        ends = np.cumsum(lengths)
+        valid = np.ones(len(shingles), dtype=bool)
+        for offset in range(1, SHINGLE_SIZE):
+            crossing = ends - offset
+            valid[crossing[crossing < len(shingles)]] = False
+        shingles = shingles[valid].astype(np.uint64)
+
+        counts = lengths - (SHINGLE_SIZE - 1)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+        signatures = np.empty((len(titles), len(self._mult)), dtype=np.uint64)
+        with np.errstate(over="ignore"):
+            for k in range(len(self._mult)):
+                hashed = (shingles * self._mult[k] + self._add[k]) >> np.uint64(32)
+                signatures[:, k] = np.minimum.reduceat(hashed, starts)
+        return signatures
+
+    def duplicate_mask(self, signatures: np.ndarray) -> np.ndarray:
+        """
+        Mark rows that share an LSH band with an earlier row.
+
+        Args:
+            signatures: MinHash signatures in priority order
+
+        Returns:
+            Boolean array, True for duplicates of an earlier row
+        """
+        n = len(signatures)
+        duplicate = np.zeros(n, dtype=bool)
+        positions = np.arange(n)
+
+        with np.errstate(over="ignore"):
+            for band in range(self.bands):
+                rows = signatures[:, band * self.rows:(band + 1) * self.rows]
+                keys = np.bitwise_xor.reduce(rows * self._band_mix, axis=1)
+                _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+                duplicate |= first[inverse.ravel()] != positions
+
+        return duplicate
+
+    def scores(self, published: np.ndarray, sources: Sequence[Optional[str]], now: float) -> np.ndarray:
+        """
+        Score articles by recency and source diversity.
+
+        Args:
+            published: Epoch seconds per article (NaN = unknown), in priority order
+            sources: Source name per article
+            now: Current epoch seconds
+
+        Returns:
+            Score per article (higher is better)
+        """
+        age_hours = np.clip((now - published) / 3600.0, 0.0, None)
+        recency = np.where(np.isnan(age_hours), 0.0, 0.5 ** (np.nan_to_num(age_hours) / self.half_life_hours))
+
+        # Rank of each article within its source, in priority order
+        _, codes = np.unique(np.array([s or "" for s in sources], dtype=object), return_inverse=True)
+        codes = codes.ravel()
+        order = np.lexsort((np.arange(len(codes)), codes))
+        sorted_codes = codes[order]
+        group_start = np.concatenate(([True], sorted_codes[1:] != sorted_codes[:-1]))
+        start_index = np.maximum.accumulate(np.where(group_start, np.arange(len(order)), 0))
+        source_rank = np.empty(len(order), dtype=np.int64)
+        source_rank[order] = np.arange(len(order)) - start_index
+
+        # Tiny recency floor keeps undated articles ordered by source diversity
+        return (recency + 1e-9) * self.source_penalty ** source_rank
+
+    def rank(self, articles: Sequence[NewsArticle], top_k: int, now: Optional[float] = None) -> List[NewsArticle]:
+        """
+        Deduplicate and rank articles, keeping the top K.
+
+        Args:
+            articles: Fetched articles
+            top_k: Number of articles to keep
+            now: Current epoch seconds (defaults to the current time)
+
+        Returns:
+            Up to top_k distinct articles, best first
+        """
+        if not articles or top_k <= 0:
+            return []
+
+        if now is None:
+            now = datetime.now().timestamp()
+
+        published = _parse_published([a.published_at for a in articles])
+
+        # Most recent first, so each duplicate cluster keeps its newest article
+        order = np.argsort(np.nan_to_num(-published, nan=np.inf), kind="stable")
+        signatures = self.signatures([articles[i].title for i in order])
+        kept = order[~self.duplicate_mask(signatures)]
+
+        scores = self.scores(published[kept], [articles[i].source for i in kept], now)
+        best = kept[np.argsort(-scores, kind="stable")[:top_k]]
+        return [articles[i] for i in best]
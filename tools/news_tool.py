@@ -3,9 +3,8 @@ News Tool for AI Operations Assistant.
 Fetches latest news articles using NewsAPI.
 """
 
-import requests
-from typing import Dict, Any
 from config import Config
+from records import NewsArticle, NewsResult
 
 
 class NewsTool:
@@ -15,17 +14,38 @@ class NewsTool:
         """Initialize news tool."""
         self.api_url = Config.NEWS_API_URL
         self.api_key = Config.NEWS_API_KEY
+        self._session = None
+        self._ranker = None
     
-    def get_news(self, query: str, max_results: int = 5) -> Dict[str, Any]:
+    @property
+    def session(self):
+        """HTTP session (connection pool), created on first use."""
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session
+    
+    @property
+    def ranker(self):
+        """Article ranker, created (and NumPy imported) on first use."""
+        if self._ranker is None:
+            from tools.news_ranker import NewsRanker
+            self._ranker = NewsRanker()
+        return self._ranker
+    
+    def get_news(self, query: str, max_results: int = 5) -> NewsResult:
         """
         Get latest news articles for a given query.
         
+        Fetches a larger pool of articles, drops near-duplicate (syndicated)
+        stories and keeps the most recent ones from diverse sources.
+        
         Args:
             query: Search query for news
             max_results: Maximum number of articles to return
             
         Returns:
-            Dictionary containing news articles
+            Record containing news articles
             
         Raises:
             RuntimeError: If API call fails
@@ -33,12 +53,14 @@ class NewsTool:
         params = {
             "q": query,
             "apiKey": self.api_key,
-            "pageSize": max_results,
+            "pageSize": max(max_results, Config.NEWS_FETCH_POOL_SIZE),
             "language": "en"
         }
         
+        import requests
+        
         try:
-            response = requests.get(self.api_url, params=params, timeout=10)
+            response = self.session.get(self.api_url, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -46,21 +68,23 @@ class NewsTool:
             if data.get("status") != "ok":
                 raise RuntimeError(f"News API error: {data.get('message', 'Unknown error')}")
             
-            articles = []
-            for article in data.get("articles", [])[:max_results]:
-                articles.append({
-                    "title": article.get("title", ""),
-                    "description": article.get("description", ""),
-                    "url": article.get("url", ""),
-                    "source": article.get("source", {}).get("name", ""),
-                    "published_at": article.get("publishedAt", "")
-                })
+            articles = [
+                NewsArticle(
+                    title=article.get("title", ""),
+                    description=article.get("description", ""),
+                    url=article.get("url", ""),
+                    source=article.get("source", {}).get("name", ""),
+                    published_at=article.get("publishedAt", "")
+                )
+                for article in data.get("articles", [])
+            ]
+            articles = self.ranker.rank(articles, max_results)
             
-            return {
-                "query": query,
-                "total_results": len(articles),
-                "articles": articles
-            }
+            return NewsResult(
+                query=query,
+                total_results=len(articles),
+                articles=articles
+            )
             
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"News API request failed: {e}")
@@ -3,9 +3,8 @@ Weather Tool for AI Operations Assistant.
 Fetches current weather information using WeatherAPI.
 """
 
-import requests
-from typing import Dict, Any
 from config import Config
+from records import WeatherReport
 
 
 class WeatherTool:
@@ -15,8 +14,17 @@ class WeatherTool:
         """Initialize weather tool."""
         self.api_url = Config.WEATHER_API_URL
         self.api_key = Config.WEATHER_API_KEY
+        self._session = None
     
-    def get_weather(self, city: str) -> Dict[str, Any]:
+    @property
+    def session(self):
+        """HTTP session (connection pool), created on first use."""
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session
+    
+    def get_weather(self, city: str) -> WeatherReport:
         """
         Get current weather for a city.
         
@@ -24,15 +32,17 @@ class WeatherTool:
             city: City name
             
         Returns:
-            Dictionary containing weather information
+            Record containing weather information (temperature is None if unavailable)
             
         Raises:
             RuntimeError: If API call fails
         """
         params = {"key": self.api_key, "q": city}
         
+        import requests
+        
         try:
-            response = requests.get(self.api_url, params=params, timeout=10)
+            response = self.session.get(self.api_url, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -43,11 +53,13 @@ class WeatherTool:
             current = data.get("current", {})
             location = data.get("location", {})
             
-            return {
-                "city": location.get("name", city),
-                "temperature_c": str(current.get("temp_c", "N/A")),
-                "condition": current.get("condition", {}).get("text", "N/A")
-            }
+            temperature = current.get("temp_c")
+            
+            return WeatherReport(
+                city=location.get("name", city),
+                temperature_c=float(temperature) if temperature is not None else None,
+                condition=current.get("condition", {}).get("text", "N/A")
+            )
             
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"Weather API request failed: {e}")
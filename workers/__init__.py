@@ -0,0 +1,4 @@
+"""Workers module for AI Operations Assistant."""
+from .process_pool import TaskWorkerPool
+
+__all__ = ["TaskWorkerPool"]
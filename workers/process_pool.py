@@ -0,0 +1,124 @@
+"""
+Process pool execution backend for AI Operations Assistant.
+Runs whole tasks in worker processes, each holding a pre-warmed assistant
+(agents, LLM client and HTTP connection pools) for its lifetime.
+"""
+
+import multiprocessing
+import os
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from config import Config
+
+
+# Assistant owned by the current worker process
+_worker_assistant = None
+
+
+def _init_worker(factory: Callable[[], Any], quiet: bool) -> None:
+    """
+    Build the worker's assistant once, before it accepts tasks.
+
+    Args:
+        factory: Picklable callable returning an object with process_task()
+        quiet: If True, discard the worker's console output
+    """
+    global _worker_assistant
+
+    if quiet:
+        sys.stdout = open(os.devnull, "w")
+
+    _worker_assistant = factory()
+
+
+def _run_task(task: str) -> Dict[str, Any]:
+    """Process one task on the worker's assistant."""
+    return _worker_assistant.process_task(task)
+
+
+def _default_factory():
+    """Build the standard assistant (imported lazily inside the worker), fully warmed up."""
+    from main import AIOpsAssistant
+    assistant = AIOpsAssistant()
+    # Building the assistant is lazy; create clients, tools and sessions before the first task
+    assistant.warm_up().join()
+    return assistant
+
+
+class TaskWorkerPool:
+    """Pool of worker processes that each run whole tasks."""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        factory: Callable[[], Any] = _default_factory,
+        quiet: bool = True
+    ):
+        """
+        Initialize worker pool.
+
+        Args:
+            workers: Number of worker processes (defaults to config, 0 = CPU count)
+            factory: Picklable callable building each worker's assistant
+            quiet: If True, worker console output is discarded
+        """
+        if workers is None:
+            workers = Config.WORKER_PROCESSES
+        self.workers = workers or os.cpu_count() or 1
+
+        # Spawn keeps workers independent of coordinator threads and sockets
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(factory, quiet)
+        )
+
+    def submit(self, task: str) -> Future:
+        """
+        Submit a task to the pool.
+
+        Args:
+            task: Natural language task
+
+        Returns:
+            Future resolving to the task's final result
+        """
+        return self._executor.submit(_run_task, task)
+
+    def map(self, tasks: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Process tasks across the pool.
+
+        Args:
+            tasks: Natural language tasks
+
+        Returns:
+            Results in the same order as tasks
+        """
+        futures = [self.submit(task) for task in tasks]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append({"status": "failed", "error": str(e), "stage": "worker"})
+        return results
+
+    def warm_up(self) -> None:
+        """Start workers and build their assistants now instead of on first task."""
+        futures = [self._executor.submit(os.getpid) for _ in range(self.workers)]
+        for future in futures:
+            future.result()
+
+    def close(self) -> None:
+        """Shut down the pool, waiting for running tasks."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "TaskWorkerPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()